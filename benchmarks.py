@@ -1,20 +1,50 @@
 """Performance benchmarking suite for Sudoku solver algorithms"""
 
+import functools
+import gc
+import io
 import json
+import math
+import os
+import signal
 import statistics
+import threading
 import time
-from typing import Dict, List
-
-from sudoku_solver.algorithms.backtracking import BacktrackingSolver
-from sudoku_solver.algorithms.backtracking_mrv import BacktrackingMRVSolver
-from sudoku_solver.algorithms.dancing_links import DancingLinksSolver
-from sudoku_solver.algorithms.naked_singles import NakedSinglesSolver
+from collections import defaultdict
+from types import MappingProxyType
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    TimeoutError as FutureTimeoutError,
+    as_completed,
+)
+from typing import Dict, List, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+from sudoku_solver.algorithms import registry
 from sudoku_solver.utils.puzzle_loader import PuzzleLoader
 
 
 class BenchmarkEntry:
     """Entry for a single algorithm benchmark run."""
 
+    # Fixed field set; slots drop the per-instance __dict__, shrinking the
+    # thousands of entries a multi-run suite accumulates
+    __slots__ = (
+        "algorithm",
+        "puzzle_name",
+        "puzzle_difficulty",
+        "execution_time",
+        "cells_assigned",
+        "guesses",
+        "solved",
+        "solution",
+    )
+
     def __init__(self, algorithm: str, puzzle_name: str, puzzle_difficulty: str):
         self.algorithm = algorithm
         self.puzzle_name = puzzle_name
@@ -26,82 +56,231 @@ class BenchmarkEntry:
         self.solution = None
 
 
-class BenchmarkSuite:
-    """Comprehensive benchmarking suite for Sudoku solvers."""
+def _raise_timeout(signum, frame):
+    """SIGALRM handler: abort a runaway solve."""
+    raise TimeoutError
 
-    ALGORITHMS = {
-        "Backtracking": BacktrackingSolver,
-        "Backtracking + MRV": BacktrackingMRVSolver,
-        "Naked Singles": NakedSinglesSolver,
-        "Dancing Links": DancingLinksSolver,
-    }
 
-    def __init__(self):
-        """Initialize benchmark suite."""
-        self.results: List[BenchmarkEntry] = []
-        self.puzzles: Dict[str, Dict] = {}
-        self._load_puzzles()
-
-    def _load_puzzles(self):
-        """Load all test puzzles."""
-        exemplars = PuzzleLoader.exemplars()
-
-        # Standard exemplar puzzles
-        self.puzzles["exemplars"] = {
-            "easy": exemplars.get("easy", ""),
-            "medium": exemplars.get("medium", ""),
-            "hard": exemplars.get("hard", ""),
-            "very_hard": exemplars.get("expert", "").replace(".", "0"),
-        }
+def _summarize(xs: List[float]) -> Tuple[float, float, float, float]:
+    """
+    One-pass mean/min/max/population-stdev over a sample list.
+
+    Uses Welford's online update so the list is walked once instead of the
+    four separate passes mean/min/max/pstdev would each take.
+
+    Args:
+        xs: Sample values; may be empty
 
-        # Add additional test puzzles
-        self.puzzles["additional"] = {
-            "empty_board": "0" * 81,
-            "single_clue": (
-                "100000000000000000000000000000000000000000000000000000"
-                "000000000000000000000000000"
+    Returns:
+        (mean, min, max, stdev); (inf, inf, inf, 0.0) for an empty sample
+    """
+    n = len(xs)
+    if not n:
+        inf = float("inf")
+        return inf, inf, inf, 0.0
+
+    mn = mx = xs[0]
+    mean = 0.0
+    m2 = 0.0
+    for i, x in enumerate(xs, 1):
+        if x < mn:
+            mn = x
+        elif x > mx:
+            mx = x
+        delta = x - mean
+        mean += delta / i
+        m2 += delta * (x - mean)
+
+    stdev = math.sqrt(m2 / n) if n > 1 else 0.0
+    return mean, mn, mx, stdev
+
+
+def _avg_time(item: Tuple[str, Dict]) -> float:
+    """Sort key: mean execution time of an (algorithm, result) pair."""
+    return item[1]["avg_time"]
+
+
+@functools.lru_cache(maxsize=1)
+def _puzzle_catalog() -> MappingProxyType:
+    """
+    Build the benchmark puzzle catalog once per process.
+
+    Returns:
+        Immutable mapping of category -> {puzzle_name: puzzle_str}; safe to
+        share across repeated suite instantiations and pool workers
+    """
+    exemplars = PuzzleLoader.exemplars()
+
+    return MappingProxyType(
+        {
+            "exemplars": MappingProxyType(
+                {
+                    "easy": exemplars.get("easy", ""),
+                    "medium": exemplars.get("medium", ""),
+                    "hard": exemplars.get("hard", ""),
+                    "very_hard": exemplars.get("expert", "").replace(".", "0"),
+                }
             ),
-            "minimal": (
-                "100000002020000080003000004000100000005000600000001000"
-                "700000300090000010800000009"
+            "additional": MappingProxyType(
+                {
+                    "empty_board": "0" * 81,
+                    "single_clue": (
+                        "100000000000000000000000000000000000000000000000000000"
+                        "000000000000000000000000000"
+                    ),
+                    "minimal": (
+                        "100000002020000080003000004000100000005000600000001000"
+                        "700000300090000010800000009"
+                    ),
+                }
             ),
         }
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _prototype(puzzle_str: str):
+    """
+    Parse a puzzle string once per process and cache the resulting board.
+
+    Callers must take a .copy() of the returned prototype; handing the cached
+    board itself to a solver would let it be mutated in place.
+    """
+    return PuzzleLoader.from_string(puzzle_str)
+
+
+def _worker_init():
+    """Stabilize timings in benchmark workers.
+
+    Limits any BLAS pool to one thread and pins the worker to a single core
+    (Linux) so the scheduler doesn't migrate it mid-measurement.
+    """
+    os.environ["OMP_NUM_THREADS"] = "1"
+    if hasattr(os, "sched_setaffinity"):
+        cpus = sorted(os.sched_getaffinity(0))
+        os.sched_setaffinity(0, {cpus[os.getpid() % len(cpus)]})
+
+
+def _run_one(
+    algo_name: str, puzzle_str: str, puzzle_name: str, difficulty: str
+) -> "BenchmarkEntry":
+    """Run one benchmark in a worker process and return its entry.
+
+    Takes only pickle-cheap strings; the solver class is resolved inside the
+    worker. Does an unmeasured warmup solve first since workers start cold.
+    """
+    # resolve() imports only the module for this algorithm, keeping worker
+    # startup light
+    algo_class = registry.resolve(algo_name)
+    # Warm up through the same capped path as the measured run and discard
+    # the entry; a bare solve() here would run unbounded on the pathological
+    # puzzles the per-solve timeout exists for
+    BenchmarkSuite.benchmark_algorithm(
+        algo_name, algo_class, puzzle_str, puzzle_name, difficulty
+    )
+    return BenchmarkSuite.benchmark_algorithm(
+        algo_name, algo_class, puzzle_str, puzzle_name, difficulty
+    )
+
+
+class BenchmarkSuite:
+    """Comprehensive benchmarking suite for Sudoku solvers."""
+
+    def __init__(self):
+        """Initialize benchmark suite."""
+        self.results: List[BenchmarkEntry] = []
+        self.puzzles = _puzzle_catalog()
+        # Name -> class view over the shared registry; resolved here rather
+        # than at import time so merely importing benchmarks stays cheap
+        self.ALGORITHMS = dict(registry.load_algorithms())
 
+    @staticmethod
     def benchmark_algorithm(
-        self,
         algorithm_name: str,
         algorithm_class,
         puzzle_str: str,
         puzzle_name: str,
         puzzle_difficulty: str,
+        timeout_s: float = 5.0,
     ) -> BenchmarkEntry:
         """
         Benchmark a single algorithm on a single puzzle.
 
+        A per-solve timeout caps pathological cases (e.g. exhaustive
+        backtracking on the near-empty puzzles); a timed-out run is recorded
+        as unsolved and its wall time is not counted.
+
         Args:
             algorithm_name: Display name of algorithm
             algorithm_class: Solver class
             puzzle_str: Puzzle string (81 chars)
             puzzle_name: Name of puzzle
             puzzle_difficulty: Difficulty level
+            timeout_s: Per-solve timeout in seconds
 
         Returns:
             BenchmarkEntry with results
         """
         entry = BenchmarkEntry(algorithm_name, puzzle_name, puzzle_difficulty)
 
+        # SIGALRM interrupts the solve in place on POSIX; elsewhere the solve
+        # runs on a worker thread that is abandoned on timeout
+        use_alarm = (
+            hasattr(signal, "setitimer")
+            and threading.current_thread() is threading.main_thread()
+        )
+
         try:
-            # Load puzzle
-            board = PuzzleLoader.from_string(puzzle_str)
+            # Copy the cached prototype instead of reparsing the same 81
+            # characters on every run
+            board = _prototype(puzzle_str).copy()
 
-            # Run solver with timing
+            # Run solver with timing: monotonic ns clock, and GC paused so a
+            # collection can't land inside a sub-millisecond solve
             solver = algorithm_class(board)
-            start_time = time.time()
-            solved = solver.solve()
-            end_time = time.time()
+            timed_out = False
+            gc.collect()
+            gc.disable()
+            try:
+                if use_alarm:
+                    old_handler = signal.signal(signal.SIGALRM, _raise_timeout)
+                    signal.setitimer(signal.ITIMER_REAL, timeout_s)
+                    try:
+                        start_time = time.perf_counter_ns()
+                        solved = solver.solve()
+                        end_time = time.perf_counter_ns()
+                    except TimeoutError:
+                        timed_out = True
+                        solved = False
+                    finally:
+                        signal.setitimer(signal.ITIMER_REAL, 0)
+                        signal.signal(signal.SIGALRM, old_handler)
+                else:
+                    pool = ThreadPoolExecutor(max_workers=1)
+                    future = pool.submit(solver.solve)
+                    try:
+                        start_time = time.perf_counter_ns()
+                        solved = future.result(timeout=timeout_s)
+                        end_time = time.perf_counter_ns()
+                    except FutureTimeoutError:
+                        timed_out = True
+                        solved = False
+                    finally:
+                        # Don't block on a runaway solve; the daemonless
+                        # thread is abandoned and dies with the process
+                        pool.shutdown(wait=False)
+            finally:
+                gc.enable()
+
+            if timed_out:
+                print(
+                    f"  {algorithm_name} timed out on {puzzle_name} "
+                    f"after {timeout_s:.1f}s"
+                )
+                return entry
 
             # Collect statistics
-            entry.execution_time = end_time - start_time
+            entry.execution_time = (end_time - start_time) * 1e-9
             entry.solved = solved
 
             if solved:
@@ -116,74 +295,154 @@ class BenchmarkSuite:
 
         return entry
 
-    def run_full_benchmark(self, num_runs: int = 3) -> Dict:
+    def _run_parallel(
+        self, num_runs: int
+    ) -> Dict[Tuple[str, str, str], List[BenchmarkEntry]]:
+        """
+        Dispatch all benchmark runs to a process pool.
+
+        Args:
+            num_runs: Number of times to run each test
+
+        Returns:
+            Entries grouped by (category, puzzle_name, algorithm) key
+        """
+        entries_by_key: Dict[Tuple[str, str, str], List[BenchmarkEntry]] = {}
+
+        with ProcessPoolExecutor(
+            max_workers=os.cpu_count(), initializer=_worker_init
+        ) as executor:
+            futures = {}
+            for puzzle_category, puzzles in self.puzzles.items():
+                for puzzle_name, puzzle_str in puzzles.items():
+                    difficulty = (
+                        puzzle_name if puzzle_category == "exemplars" else "custom"
+                    )
+                    for algo_name in self.ALGORITHMS:
+                        for _ in range(num_runs):
+                            future = executor.submit(
+                                _run_one,
+                                algo_name,
+                                puzzle_str,
+                                puzzle_name,
+                                difficulty,
+                            )
+                            futures[future] = (
+                                puzzle_category,
+                                puzzle_name,
+                                algo_name,
+                            )
+
+            for future in as_completed(futures):
+                entries_by_key.setdefault(futures[future], []).append(
+                    future.result()
+                )
+
+        return entries_by_key
+
+    @staticmethod
+    def _aggregate_runs(entries: List[BenchmarkEntry], num_runs: int) -> Dict:
+        """
+        Aggregate benchmark entries for one (algorithm, puzzle) pair.
+
+        Args:
+            entries: Entries from repeated runs
+            num_runs: Number of runs requested
+
+        Returns:
+            Dictionary with aggregate statistics
+        """
+        times = [e.execution_time for e in entries if e.solved]
+        cells_assigned = [e.cells_assigned for e in entries if e.solved]
+        guesses = [e.guesses for e in entries if e.solved]
+
+        avg_time, min_time, max_time, stdev_time = _summarize(times)
+
+        return {
+            "success_rate": len(times) / num_runs,
+            "avg_time": avg_time,
+            "min_time": min_time,
+            "max_time": max_time,
+            "stdev_time": stdev_time,
+            "avg_cells": (
+                statistics.fmean(cells_assigned) if cells_assigned else 0
+            ),
+            "avg_guesses": statistics.fmean(guesses) if guesses else 0,
+        }
+
+    def run_full_benchmark(self, num_runs: int = 3, parallel: bool = True) -> Dict:
         """
         Run complete benchmarking suite.
 
         Args:
             num_runs: Number of times to run each test
+            parallel: Fan runs out to a process pool; set False for a
+                      deterministic serial run (e.g. under a profiler)
 
         Returns:
             Dictionary with aggregated results
         """
         print(f"Starting Sudoku Solver Benchmark Suite ({num_runs} runs per test)")
+        print("One untimed warmup solve per (algorithm, puzzle) precedes the runs")
         print("=" * 80)
 
         all_results = {}
         total_benchmarks = 0
+        extend_results = self.results.extend
+
+        entries_by_key = self._run_parallel(num_runs) if parallel else None
 
         # Benchmark each puzzle with each algorithm
         for puzzle_category, puzzles in self.puzzles.items():
-            all_results[puzzle_category] = {}
+            category_results = all_results[puzzle_category] = {}
+            is_exemplar = puzzle_category == "exemplars"
 
             for puzzle_name, puzzle_str in puzzles.items():
-                all_results[puzzle_category][puzzle_name] = {}
-
-                # Determine difficulty
-                if puzzle_category == "exemplars":
-                    difficulty = puzzle_name
-                else:
-                    difficulty = "custom"
+                # Loop invariants for the algorithm loop below: difficulty and
+                # the per-puzzle result dict are fixed per puzzle
+                per_puzzle = category_results[puzzle_name] = {}
+                difficulty = puzzle_name if is_exemplar else "custom"
 
                 print(
                     f"\nBenchmarking {puzzle_category}/{puzzle_name} ({difficulty})..."
                 )
 
                 for algo_name, algo_class in self.ALGORITHMS.items():
-                    times = []
-                    cells_assigned = []
-                    guesses = []
-                    success_count = 0
-
-                    for run in range(num_runs):
-                        entry = self.benchmark_algorithm(
-                            algo_name, algo_class, puzzle_str, puzzle_name, difficulty
+                    if entries_by_key is not None:
+                        entries = entries_by_key.get(
+                            (puzzle_category, puzzle_name, algo_name), []
                         )
-                        self.results.append(entry)
-
-                        if entry.solved:
-                            times.append(entry.execution_time)
-                            cells_assigned.append(entry.cells_assigned)
-                            guesses.append(entry.guesses)
-                            success_count += 1
-
-                        total_benchmarks += 1
-
-                    # Aggregate results
-                    result = {
-                        "success_rate": success_count / num_runs,
-                        "avg_time": statistics.mean(times) if times else float("inf"),
-                        "min_time": min(times) if times else float("inf"),
-                        "max_time": max(times) if times else float("inf"),
-                        "stdev_time": statistics.stdev(times) if len(times) > 1 else 0,
-                        "avg_cells": (
-                            statistics.mean(cells_assigned) if cells_assigned else 0
-                        ),
-                        "avg_guesses": statistics.mean(guesses) if guesses else 0,
-                    }
-
-                    all_results[puzzle_category][puzzle_name][algo_name] = result
+                    else:
+                        # One unmeasured warmup solve so import and class-
+                        # level caches don't bias the first measured run;
+                        # going through benchmark_algorithm keeps the
+                        # per-solve timeout cap on it
+                        self.benchmark_algorithm(
+                            algo_name,
+                            algo_class,
+                            puzzle_str,
+                            puzzle_name,
+                            difficulty,
+                        )
+
+                        entries = [
+                            self.benchmark_algorithm(
+                                algo_name,
+                                algo_class,
+                                puzzle_str,
+                                puzzle_name,
+                                difficulty,
+                            )
+                            for _ in range(num_runs)
+                        ]
 
+                    extend_results(entries)
+                    total_benchmarks += len(entries)
+
+                    result = self._aggregate_runs(entries, num_runs)
+                    per_puzzle[algo_name] = result
+
+                    success_count = sum(1 for e in entries if e.solved)
                     status = "✓" if success_count == num_runs else "✗"
                     print(
                         f"  {algo_name}: {status} {result['avg_time']:.4f}s (±{result['stdev_time']:.4f}s)"
@@ -204,74 +463,80 @@ class BenchmarkSuite:
         Returns:
             Formatted table string
         """
-        lines = []
-        lines.append("SUDOKU SOLVER PERFORMANCE COMPARISON")
-        lines.append("=" * 120)
+        # Stream into one growable buffer instead of accumulating a list of
+        # small strings; the sort key is hoisted so it isn't rebuilt per puzzle
+        buf = io.StringIO()
+        w = buf.write
+        avg_time_of = _avg_time
+
+        w("SUDOKU SOLVER PERFORMANCE COMPARISON\n")
+        w("=" * 120)
+        w("\n")
 
         for puzzle_category, puzzles in results.items():
-            lines.append(f"\n{puzzle_category.upper()}")
-            lines.append("-" * 120)
+            w(f"\n{puzzle_category.upper()}\n")
+            w("-" * 120)
+            w("\n")
 
             for puzzle_name, algo_results in puzzles.items():
-                lines.append(f"\n  {puzzle_name.upper()}")
+                w(f"\n  {puzzle_name.upper()}\n")
 
                 # Header
-                header = (
+                w(
                     "  "
-                    + f"{'Algorithm':<20} {'Time (s)':<15} "
-                    + f"{'Cells':<10} {'Guesses':<10} {'Success':<10}"
+                    f"{'Algorithm':<20} {'Time (s)':<15} "
+                    f"{'Cells':<10} {'Guesses':<10} {'Success':<10}\n"
                 )
-                lines.append(header)
-                lines.append("  " + "-" * 80)
+                w("  " + "-" * 80 + "\n")
 
                 # Sort by execution time
-                sorted_algos = sorted(
-                    algo_results.items(), key=lambda x: x[1]["avg_time"]
-                )
-
-                fastest = sorted_algos[0][1]["avg_time"]
+                sorted_algos = sorted(algo_results.items(), key=avg_time_of)
 
                 for algo_name, result in sorted_algos:
                     time_str = f"{result['avg_time']:.4f}±{result['stdev_time']:.4f}"
-                    speedup = (
-                        fastest / result["avg_time"] if result["avg_time"] > 0 else 1
-                    )
-                    _speedup_str = f"({speedup:.1f}x)" if speedup > 1 else ""
 
-                    line = (
+                    w(
                         f"  {algo_name:<20} "
                         f"{time_str:<15} "
                         f"{result['avg_cells']:<10.0f} "
                         f"{result['avg_guesses']:<10.0f} "
-                        f"{result['success_rate']*100:<9.0f}%"
+                        f"{result['success_rate']*100:<9.0f}%\n"
                     )
-                    lines.append(line)
 
-        return "\n".join(lines)
+        return buf.getvalue().rstrip("\n")
+
+    # Fields written by save_results (the full solution string is omitted)
+    _SAVE_FIELDS = (
+        "algorithm",
+        "puzzle_name",
+        "puzzle_difficulty",
+        "execution_time",
+        "cells_assigned",
+        "guesses",
+        "solved",
+    )
 
     def save_results(self, filepath: str = "benchmark_results.json"):
         """
         Save benchmark results to JSON file.
 
+        Serializes with orjson when available; its C encoder writes bytes
+        directly and is several times faster than stdlib json on long runs.
+
         Args:
             filepath: Path to save results
         """
-        data = []
-        for entry in self.results:
-            data.append(
-                {
-                    "algorithm": entry.algorithm,
-                    "puzzle_name": entry.puzzle_name,
-                    "puzzle_difficulty": entry.puzzle_difficulty,
-                    "execution_time": entry.execution_time,
-                    "cells_assigned": entry.cells_assigned,
-                    "guesses": entry.guesses,
-                    "solved": entry.solved,
-                }
-            )
-
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=2)
+        data = [
+            {field: getattr(entry, field) for field in self._SAVE_FIELDS}
+            for entry in self.results
+        ]
+
+        if orjson is not None:
+            with open(filepath, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filepath, "w") as f:
+                json.dump(data, f, indent=2)
 
         print(f"\nResults saved to {filepath}")
 
@@ -289,19 +554,17 @@ class BenchmarkSuite:
         lines.append("\nSUMMARY STATISTICS")
         lines.append("=" * 80)
 
-        # Overall fastest algorithm
-        all_times = {}
+        # Overall fastest algorithm: single pass, missing keys default to []
+        all_times: Dict[str, List[float]] = defaultdict(list)
         for puzzles in results.values():
             for algo_results in puzzles.values():
                 for algo_name, result in algo_results.items():
-                    if algo_name not in all_times:
-                        all_times[algo_name] = []
                     if result["avg_time"] < float("inf"):
                         all_times[algo_name].append(result["avg_time"])
 
         if all_times:
             avg_by_algo = {
-                algo: statistics.mean(times) for algo, times in all_times.items()
+                algo: statistics.fmean(times) for algo, times in all_times.items()
             }
 
             lines.append("\nAverage execution time by algorithm:")
@@ -1,23 +1,80 @@
 """Profiling and optimization utilities for Sudoku solver."""
 
 import cProfile
-import io
+import gc
 import pstats
 import time
 import tracemalloc
 from typing import Dict, List
 
-from sudoku_solver.algorithms.backtracking import BacktrackingSolver
-from sudoku_solver.algorithms.backtracking_mrv import BacktrackingMRVSolver
-from sudoku_solver.algorithms.dancing_links import DancingLinksSolver
-from sudoku_solver.algorithms.naked_singles import NakedSinglesSolver
+import numpy as np
+
+try:
+    import yappi
+except ImportError:  # pragma: no cover - optional low-overhead profiler
+    yappi = None
+
+from sudoku_solver.algorithms.registry import load_algorithms
 from sudoku_solver.core.sudoku import SudokuBoard
 from sudoku_solver.utils.puzzle_loader import PuzzleLoader
 
 
+def _popcount16(x: np.ndarray) -> np.ndarray:
+    """Per-element popcount of a uint16 array via unpackbits."""
+    x = np.ascontiguousarray(x, dtype=np.uint16)
+    return np.unpackbits(x.view(np.uint8)).reshape(-1, 16).sum(axis=1)
+
+
+def _candidate_bits(board: SudokuBoard) -> np.ndarray:
+    """Pack candidate sets into a 9x9 uint16 bitmask array (bit d-1 = digit d)."""
+    return np.array(
+        [
+            [
+                sum(1 << (v - 1) for v in board.candidates[r][c])
+                for c in range(9)
+            ]
+            for r in range(9)
+        ],
+        dtype=np.uint16,
+    )
+
+
+def _validate_board_array(arr: np.ndarray) -> bool:
+    """
+    Vectorized conflict check over a 9x9 int board array (0 = empty).
+
+    Each unit is reduced to a 9-bit OR of value bits; the unit is
+    conflict-free iff the popcount equals its filled-cell count.
+    """
+    bits = np.where(arr > 0, np.left_shift(1, arr.astype(np.int32) - 1), 0)
+    filled = (arr > 0).astype(np.int32)
+
+    for unit_bits, unit_filled in (
+        (bits, filled),  # rows
+        (bits.T, filled.T),  # columns
+        (
+            bits.reshape(3, 3, 3, 3).transpose(0, 2, 1, 3).reshape(9, 9),
+            filled.reshape(3, 3, 3, 3).transpose(0, 2, 1, 3).reshape(9, 9),
+        ),  # boxes
+    ):
+        ors = np.bitwise_or.reduce(unit_bits, axis=1)
+        if not np.array_equal(_popcount16(ors), unit_filled.sum(axis=1)):
+            return False
+    return True
+
+
 class ProfileResult:
     """Result from a profiling run."""
 
+    __slots__ = (
+        "algorithm",
+        "puzzle_name",
+        "total_time",
+        "peak_memory",
+        "avg_memory",
+        "top_functions",
+    )
+
     def __init__(self, algorithm: str, puzzle_name: str):
         self.algorithm = algorithm
         self.puzzle_name = puzzle_name
@@ -35,7 +92,12 @@ class Profiler:
         self.results: List[ProfileResult] = []
 
     def profile_algorithm(
-        self, algorithm_class, puzzle_str: str, algorithm_name: str, puzzle_name: str
+        self,
+        algorithm_class,
+        puzzle_str: str,
+        algorithm_name: str,
+        puzzle_name: str,
+        profiler_backend: str = "cprofile",
     ) -> ProfileResult:
         """
         Profile a single algorithm on a puzzle.
@@ -45,51 +107,68 @@ class Profiler:
             puzzle_str: Puzzle string
             algorithm_name: Name of algorithm
             puzzle_name: Name of puzzle
+            profiler_backend: "cprofile", or "yappi" for the lower-overhead
+                              wall-clock profiler (falls back to cProfile if
+                              yappi is not installed)
 
         Returns:
             ProfileResult with profiling data
         """
         result = ProfileResult(algorithm_name, puzzle_name)
-
-        # CPU profiling
-        pr = cProfile.Profile()
-
-        # Memory profiling setup
-        tracemalloc.start()
+        use_yappi = profiler_backend == "yappi" and yappi is not None
 
         try:
-            board = PuzzleLoader.from_string(puzzle_str)
-
-            # Start profiling
-            start_time = time.time()
-            pr.enable()
-
-            # Run solver
-            solver = algorithm_class(board)
+            # Pass 1 - timing: no profiler or tracer attached, so total_time
+            # reflects the real solve speed rather than instrumented speed
+            solver = algorithm_class(PuzzleLoader.from_string(puzzle_str))
+            start_time = time.perf_counter_ns()
+            solver.solve()
+            end_time = time.perf_counter_ns()
+            result.total_time = (end_time - start_time) * 1e-9
+
+            # Pass 2 - CPU profile on a fresh board, without tracemalloc
+            # active (the two instruments roughly double each other's cost)
+            solver = algorithm_class(PuzzleLoader.from_string(puzzle_str))
+            if use_yappi:
+                # Reuse the one process-wide yappi session; clearing stats
+                # is cheaper than tearing the instrumentation down per run
+                yappi.set_clock_type("wall")
+                yappi.clear_stats()
+                yappi.start()
+                solver.solve()
+                yappi.stop()
+            else:
+                pr = cProfile.Profile()
+                pr.enable()
+                solver.solve()
+                pr.disable()
+
+            # Pass 3 - memory trace on a fresh board, without cProfile
+            tracemalloc.start()
+            tracemalloc.reset_peak()
+            solver = algorithm_class(PuzzleLoader.from_string(puzzle_str))
             solver.solve()
-
-            # Stop profiling
-            pr.disable()
-            end_time = time.time()
-
-            # Get memory stats
             current, peak = tracemalloc.get_traced_memory()
             tracemalloc.stop()
 
-            result.total_time = end_time - start_time
             result.peak_memory = peak / (1024 * 1024)  # Convert to MB
             result.avg_memory = current / (1024 * 1024)  # Convert to MB
 
-            # Get top functions by time
-            s = io.StringIO()
-            ps = pstats.Stats(pr, stream=s).sort_stats("cumulative")
-            ps.print_stats(10)  # Top 10 functions
-
-            # Parse results
-            lines = s.getvalue().split("\n")
-            for line in lines[5:15]:  # Skip header, get top 10
-                if line.strip():
-                    result.top_functions.append(line.strip())
+            # Top functions by cumulative time, read straight from the
+            # profiler's tables instead of parsing printed output
+            if use_yappi:
+                for stat in yappi.get_func_stats().sort("ttot").get()[:10]:
+                    result.top_functions.append(
+                        (stat.full_name, stat.ttot, stat.ncall)
+                    )
+            else:
+                ps = pstats.Stats(pr).sort_stats("cumulative")
+                for func in ps.fcn_list[:10]:
+                    _cc, ncalls, _tt, cumtime, _callers = ps.stats[func]
+                    filename, lineno, func_name = func
+                    result.top_functions.append(
+                        (f"{filename}:{lineno}({func_name})", cumtime, ncalls)
+                    )
 
             self.results.append(result)
 
@@ -109,15 +188,8 @@ class Profiler:
         Returns:
             Dictionary of results by algorithm
         """
-        algorithms = {
-            "Backtracking": BacktrackingSolver,
-            "Backtracking + MRV": BacktrackingMRVSolver,
-            "Naked Singles": NakedSinglesSolver,
-            "Dancing Links": DancingLinksSolver,
-        }
-
         results = {}
-        for algo_name, algo_class in algorithms.items():
+        for algo_name, algo_class in load_algorithms():
             print(f"Profiling {algo_name} on {puzzle_name}...")
             result = self.profile_algorithm(
                 algo_class, puzzle_str, algo_name, puzzle_name
@@ -170,8 +242,9 @@ class Profiler:
 
             # Top functions
             if sorted_results[0].top_functions:
+                name, cumtime, ncalls = sorted_results[0].top_functions[0]
                 lines.append("\nTop functions (by time):")
-                lines.append(sorted_results[0].top_functions[0])
+                lines.append(f"{name}  cumtime={cumtime:.4f}s  ncalls={ncalls}")
 
         return "\n".join(lines)
 
@@ -180,63 +253,115 @@ class OptimizationAnalyzer:
     """Analyze optimization opportunities."""
 
     @staticmethod
-    def analyze_candidates_efficiency():
-        """Analyze efficiency of candidate tracking."""
-        print("Analyzing candidate tracking efficiency...")
+    def analyze_all(n: int = 2000) -> Dict:
+        """
+        Fused microbenchmark pass over one shared board.
+
+        Interleaves validation, copying and candidate scanning in a single
+        timed loop, so board construction is amortized and the interpreter
+        loop overhead is paid once instead of three times; split
+        perf_counter_ns timestamps attribute time to each operation. The
+        vectorized comparison kernels are timed afterwards at the same n.
+
+        Args:
+            n: Number of iterations for each operation
+
+        Returns:
+            Combined metrics dictionary covering all three analyses
+        """
+        print("Analyzing board operations (fused pass)...")
 
         board = SudokuBoard()
+        masks = _candidate_bits(board).ravel()
+        arr = board.as_array()
 
-        # Measure time to access candidates
-        start = time.perf_counter()
-        for _ in range(10000):
-            for r in range(9):
-                for c in range(9):
-                    _ = len(board.candidates[r][c])
-        end = time.perf_counter()
+        valid_ns = copy_ns = scan_ns = 0
+        gc.collect()
+        gc.disable()
+        try:
+            for _ in range(n):
+                t0 = time.perf_counter_ns()
+                board.is_valid()
+                t1 = time.perf_counter_ns()
+                board.copy()
+                t2 = time.perf_counter_ns()
+                sum(int(x).bit_count() for x in masks)
+                t3 = time.perf_counter_ns()
+                valid_ns += t1 - t0
+                copy_ns += t2 - t1
+                scan_ns += t3 - t2
+
+            # Vectorized kernels for comparison, timed as tight loops since
+            # their per-call cost is dominated by NumPy dispatch
+            bits = masks.reshape(9, 9)
+            start = time.perf_counter_ns()
+            for _ in range(n):
+                _popcount16(bits).sum()
+            bitmask_ns = time.perf_counter_ns() - start
+
+            start = time.perf_counter_ns()
+            for _ in range(n):
+                _validate_board_array(arr)
+            vector_ns = time.perf_counter_ns() - start
+        finally:
+            gc.enable()
+
+        valid_time = valid_ns / n * 1e-9
+        copy_time = copy_ns / n * 1e-9
+        scan_time = scan_ns / n * 1e-9
 
-        access_time = (end - start) / 10000
-        print(f"Average candidate access time: {access_time*1e6:.2f} µs")
+        print(f"Average validation time: {valid_time*1e6:.2f} µs")
+        print(f"Average board copy time: {copy_time*1e6:.2f} µs")
+        print(
+            f"Average candidate scan time: {scan_time*1e6:.2f} µs "
+            f"({scan_time / 81 * 1e9:.1f} ns/cell)"
+        )
 
         return {
-            "access_time_us": access_time * 1e6,
-            "operations_per_second": 1 / access_time,
+            "access_time_us": scan_time * 1e6,
+            "access_ns_per_cell": scan_time / 81 * 1e9,
+            "operations_per_second": 1 / scan_time,
+            "bitmask_sweep_time_us": bitmask_ns / n * 1e-3,
+            "copy_time_us": copy_time * 1e6,
+            "copies_per_second": 1 / copy_time,
+            "validation_time_us": valid_time * 1e6,
+            "validations_per_second": 1 / valid_time,
+            "vector_validation_time_us": vector_ns / n * 1e-3,
+        }
+
+    @staticmethod
+    def analyze_candidates_efficiency():
+        """Analyze efficiency of candidate tracking."""
+        metrics = OptimizationAnalyzer.analyze_all()
+        return {
+            key: metrics[key]
+            for key in (
+                "access_time_us",
+                "access_ns_per_cell",
+                "operations_per_second",
+                "bitmask_sweep_time_us",
+            )
         }
 
     @staticmethod
     def analyze_board_copy_efficiency():
         """Analyze efficiency of board copying."""
-        print("Analyzing board copy efficiency...")
-
-        board = SudokuBoard()
-
-        start = time.perf_counter()
-        for _ in range(1000):
-            _ = board.copy()
-        end = time.perf_counter()
-
-        copy_time = (end - start) / 1000
-        print(f"Average board copy time: {copy_time*1e6:.2f} µs")
-
-        return {"copy_time_us": copy_time * 1e6, "copies_per_second": 1 / copy_time}
+        metrics = OptimizationAnalyzer.analyze_all()
+        return {
+            key: metrics[key] for key in ("copy_time_us", "copies_per_second")
+        }
 
     @staticmethod
     def analyze_validation_efficiency():
         """Analyze efficiency of move validation."""
-        print("Analyzing move validation efficiency...")
-
-        board = SudokuBoard()
-
-        start = time.perf_counter()
-        for _ in range(10000):
-            board.is_valid()
-        end = time.perf_counter()
-
-        valid_time = (end - start) / 10000
-        print(f"Average validation time: {valid_time*1e6:.2f} µs")
-
+        metrics = OptimizationAnalyzer.analyze_all()
         return {
-            "validation_time_us": valid_time * 1e6,
-            "validations_per_second": 1 / valid_time,
+            key: metrics[key]
+            for key in (
+                "validation_time_us",
+                "validations_per_second",
+                "vector_validation_time_us",
+            )
         }
 
     @staticmethod
@@ -332,24 +457,13 @@ def main():
     print("=" * 100)
 
     analyzer = OptimizationAnalyzer()
-    metrics = {}
-
-    metrics["candidates"] = analyzer.analyze_candidates_efficiency()
-    print()
-    metrics["copy"] = analyzer.analyze_board_copy_efficiency()
-    print()
-    metrics["validation"] = analyzer.analyze_validation_efficiency()
+    combined_metrics = analyzer.analyze_all()
 
     # Generate recommendations
     print("\n" + "=" * 100)
     print("OPTIMIZATION RECOMMENDATIONS")
     print("=" * 100)
 
-    combined_metrics = {}
-    combined_metrics.update(metrics.get("candidates", {}))
-    combined_metrics.update(metrics.get("copy", {}))
-    combined_metrics.update(metrics.get("validation", {}))
-
     recommendations = analyzer.generate_optimization_recommendations(combined_metrics)
     for rec in recommendations:
         print(f"• {rec}")
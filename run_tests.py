@@ -19,32 +19,39 @@ class TestRunner:
         self.project_root = Path(__file__).parent
         self.tests_dir = self.project_root / "tests"
 
+    @staticmethod
+    def _run_pytest(args):
+        """Run pytest in-process, skipping interpreter startup per call."""
+        import pytest
+
+        return pytest.main(args)
+
     def run_unit_tests(self, verbose: bool = False):
         """Run unit tests only."""
-        cmd = [
-            "pytest",
-            str(self.tests_dir / "test_algorithms.py"),
-            "-v" if verbose else "-q",
-        ]
         print("Running unit tests...")
-        return subprocess.run(cmd, check=False).returncode
+        return self._run_pytest(
+            [
+                str(self.tests_dir / "test_algorithms.py"),
+                "-v" if verbose else "-q",
+            ]
+        )
 
     def run_integration_tests(self, verbose: bool = False):
         """Run integration tests only."""
-        cmd = [
-            "pytest",
-            str(self.tests_dir / "test_integration.py"),
-            "-v" if verbose else "-q",
-        ]
         print("Running integration tests...")
-        return subprocess.run(cmd, check=False).returncode
+        return self._run_pytest(
+            [
+                str(self.tests_dir / "test_integration.py"),
+                "-v" if verbose else "-q",
+            ]
+        )
 
     def run_all_tests(self, verbose: bool = False, coverage: bool = False):
         """Run all tests with optional coverage."""
-        cmd = ["pytest", str(self.tests_dir), "-v" if verbose else "-q"]
+        args = [str(self.tests_dir), "-v" if verbose else "-q"]
 
         if coverage:
-            cmd.extend(
+            args.extend(
                 [
                     "--cov=sudoku_solver",
                     "--cov-report=term-missing",
@@ -55,19 +62,23 @@ class TestRunner:
         else:
             print("Running all tests...")
 
-        return subprocess.run(cmd, check=False).returncode
+        return self._run_pytest(args)
 
     def run_benchmarks(self):
         """Run performance benchmarks."""
-        cmd = [sys.executable, "benchmarks.py"]
         print("Running benchmarks...")
-        return subprocess.run(cmd, cwd=self.project_root, check=False).returncode
+        from benchmarks import main as bench_main
+
+        bench_main()
+        return 0
 
     def run_profiling(self):
         """Run profiling and optimization analysis."""
-        cmd = [sys.executable, "profiler.py"]
         print("Running profiling and optimization analysis...")
-        return subprocess.run(cmd, cwd=self.project_root, check=False).returncode
+        from profiler import main as profile_main
+
+        profile_main()
+        return 0
 
     def run_linting(self):
         """Run code quality checks (if available)."""
@@ -1,9 +1,17 @@
-"""Sudoku solving algorithms."""
+"""Sudoku solving algorithms.
 
-from .backtracking import BacktrackingSolver
-from .backtracking_mrv import BacktrackingMRVSolver
-from .dancing_links import DancingLinksSolver
-from .naked_singles import NakedSinglesSolver
+Solver classes are imported lazily (PEP 562) so that importing the package
+does not load every algorithm module up front.
+"""
+
+from importlib import import_module
+
+_SOLVER_MODULES = {
+    "BacktrackingSolver": ".backtracking",
+    "BacktrackingMRVSolver": ".backtracking_mrv",
+    "DancingLinksSolver": ".dancing_links",
+    "NakedSinglesSolver": ".naked_singles",
+}
 
 __all__ = [
     "BacktrackingSolver",
@@ -11,3 +19,9 @@ __all__ = [
     "NakedSinglesSolver",
     "DancingLinksSolver",
 ]
+
+
+def __getattr__(name):
+    if name in _SOLVER_MODULES:
+        return getattr(import_module(_SOLVER_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,10 +1,105 @@
 """Basic backtracking algorithm for Sudoku solving."""
 
+from typing import List, Tuple
+
+from ..core.peers import BOX_OF
 from ..core.solver_base import SudokuSolver
 
+# Flat-index -> top-left index of the containing box, so the kernel does
+# one table read per node instead of two divisions and two multiplies
+_BOX_BASE = tuple((idx // 27) * 27 + ((idx % 9) // 3) * 3 for idx in range(81))
+
+
+def _is_valid(board: List[int], row_base: int, col: int, box_base: int, value: int) -> bool:
+    """Check whether a value can go in a cell of the flat board."""
+    if value in board[row_base : row_base + 9]:
+        return False
+    if value in board[col::9]:
+        return False
+    # The box is three 3-cell runs starting at its top-left corner
+    return not (
+        value in board[box_base : box_base + 3]
+        or value in board[box_base + 9 : box_base + 12]
+        or value in board[box_base + 18 : box_base + 21]
+    )
+
+
+def _search(
+    board: List[int],
+    start: int,
+    steps: List[Tuple[int, int, int]],
+    stats: List[int],
+) -> bool:
+    """
+    Iterative backtracking kernel over a flat 81-entry board.
+
+    Cells before ``start`` are already filled and stay filled, so the
+    next empty cell is found by scanning forward rather than rebuilding
+    an empty-cell list per node. The search tree is walked with an
+    explicit stack of filled cell indices instead of recursion, which
+    drops the per-node Python call overhead and sidesteps the recursion
+    limit.
+
+    Args:
+        board: Flat 81-entry board values, 0 for empty
+        start: First index that may still be empty
+        steps: Output list of (row, col, value) assignments
+        stats: Two-entry [guesses, backtracks] accumulator
+
+    Returns:
+        True if current state leads to solution, False otherwise
+    """
+    # Cells filled by the search, in placement order
+    stack: List[int] = []
+
+    idx = start
+    while idx < 81 and board[idx] != 0:
+        idx += 1
+    value = 0  # last value tried at idx
+
+    while True:
+        if idx == 81:
+            # All cells filled; every placement was validated on the way in
+            return True
+
+        row, col = divmod(idx, 9)
+        row_base = row * 9
+        box_base = _BOX_BASE[idx]
+
+        # Try each value after the last one attempted here
+        for v in range(value + 1, 10):
+            if _is_valid(board, row_base, col, box_base, v):
+                # Place value and advance to the next empty cell
+                board[idx] = v
+                steps.append((row, col, v))
+                stats[0] += 1
+                stack.append(idx)
+
+                idx += 1
+                while idx < 81 and board[idx] != 0:
+                    idx += 1
+                value = 0
+                break
+        else:
+            # Exhausted this cell: pop back to the previous placement and
+            # resume its value loop where it left off
+            if not stack:
+                return False
+            idx = stack.pop()
+            value = board[idx]
+            board[idx] = 0
+            stats[1] += 1
+
 
 class BacktrackingSolver(SudokuSolver):
-    """Basic backtracking algorithm - O(9^n) where n is number of empty cells."""
+    """Basic backtracking algorithm - O(9^n) where n is number of empty cells.
+
+    The search runs in the _search kernel on a flat board list, avoiding
+    the nested-list double indexing and per-node empty-cell list of the
+    board object; this class marshals the board in and out.
+    """
+
+    __slots__ = ()
 
     def solve(self) -> bool:
         """
@@ -13,51 +108,37 @@ class BacktrackingSolver(SudokuSolver):
         Returns:
             True if solved, False if no solution exists
         """
-        return self._solve_recursive()
+        flat_board = [v for row in self.board.board for v in row]
 
-    def _solve_recursive(self) -> bool:
-        """
-        Recursive backtracking solver.
+        # The kernel only validates its own placements, so conflicting
+        # givens must be rejected up front: one pass seeding the 27 unit
+        # masks, failing on the first duplicate clue
+        row_mask = [0] * 9
+        col_mask = [0] * 9
+        box_mask = [0] * 9
+        for idx, value in enumerate(flat_board):
+            if value:
+                bit = 1 << (value - 1)
+                r, c = divmod(idx, 9)
+                b = BOX_OF[idx]
+                if (row_mask[r] | col_mask[c] | box_mask[b]) & bit:
+                    return False
+                row_mask[r] |= bit
+                col_mask[c] |= bit
+                box_mask[b] |= bit
 
-        Returns:
-            True if current state leads to solution, False otherwise
-        """
-        # Find next empty cell
-        empty_cells = self.board.get_empty_cells()
-        if not empty_cells:
-            # All cells filled - check if valid
-            return self.board.is_solved()
-
-        row, col = empty_cells[0]
-
-        # Try each value 1-9
-        for value in range(1, 10):
-            if self._is_valid_move(row, col, value):
-                # Place value
-                self.board.board[row][col] = value
-                self._record_assignment(row, col, value)
-                self.guesses += 1
-
-                # Recurse
-                if self._solve_recursive():
-                    return True
-
-                # Backtrack
-                self.board.board[row][col] = 0
-                self.backtracks += 1
-
-        return False
+        steps: List[Tuple[int, int, int]] = []
+        stats = [0, 0]
+        solved = _search(flat_board, 0, steps, stats)
 
-    def _is_valid_move(self, row: int, col: int, value: int) -> bool:
-        """
-        Check if a value can be placed at a position.
+        self.step_history.extend(steps)
+        self.cells_assigned += len(steps)
+        self.guesses += stats[0]
+        self.backtracks += stats[1]
 
-        Args:
-            row: Row index
-            col: Column index
-            value: Value to check (1-9)
+        if solved:
+            board = self.board.board
+            for idx, value in enumerate(flat_board):
+                board[idx // 9][idx % 9] = value
 
-        Returns:
-            True if placement is valid, False otherwise
-        """
-        return self.board._is_valid_placement(row, col, value)
+        return solved
@@ -1,11 +1,386 @@
 """Backtracking with Minimum Remaining Values (MRV) heuristic."""
 
-from typing import Optional, Tuple
-import time
-import copy
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import List, Optional, Tuple
 
+import numpy as np
+
+from ..core.peers import PEERS
 from ..core.solver_base import SudokuSolver
 
+# Flat-index -> row/column/box lookups for the kernel's hot loop
+_ROW = tuple(idx // 9 for idx in range(81))
+_COL = tuple(idx % 9 for idx in range(81))
+_BOX = tuple((idx // 27) * 3 + (idx % 9) // 3 for idx in range(81))
+
+
+def _seed_masks(
+    board: List[int],
+) -> Optional[Tuple[List[int], List[int], List[int]]]:
+    """
+    Seed the per-unit placed-digit masks from a flat board's givens.
+
+    The kernel only cross-checks its own placements, so duplicate givens
+    must be caught here: folding two copies of a digit into the same mask
+    bit would otherwise let the search "solve" an unsolvable board.
+
+    Args:
+        board: Flat 81-entry board values, 0 for empty
+
+    Returns:
+        (row_mask, col_mask, box_mask) lists, or None if two givens
+        conflict (the board then has no solution)
+    """
+    row_mask = [0] * 9
+    col_mask = [0] * 9
+    box_mask = [0] * 9
+    for idx, value in enumerate(board):
+        if value != 0:
+            bit = 1 << (value - 1)
+            r, c, b = _ROW[idx], _COL[idx], _BOX[idx]
+            if (row_mask[r] | col_mask[c] | box_mask[b]) & bit:
+                return None
+            row_mask[r] |= bit
+            col_mask[c] |= bit
+            box_mask[b] |= bit
+    return row_mask, col_mask, box_mask
+
+
+def _propagate(
+    board: List[int],
+    row_mask: List[int],
+    col_mask: List[int],
+    box_mask: List[int],
+    start: int,
+    trail: List[int],
+    steps: List[Tuple[int, int, int]],
+) -> int:
+    """
+    Place forced peers transitively after an assignment (arc consistency).
+
+    Starting from the cell at ``start``, re-examines peers of every new
+    placement: a peer whose derived candidate mask collapses to a single
+    bit is assigned immediately and queued in turn, so chains of naked
+    singles resolve without costing a search node each. Placed cells are
+    appended to ``trail`` so the caller can undo them on backtrack; on
+    contradiction this pass's own placements are rolled back before
+    returning, leaving board, masks and trail exactly as on entry.
+
+    Args:
+        board: Flat 81-entry board values, 0 for empty
+        row_mask: Digits placed per row
+        col_mask: Digits placed per column
+        box_mask: Digits placed per box
+        start: Index of the just-assigned cell to propagate from
+        trail: Undo log; indices of cells placed here are appended
+        steps: Output list of (row, col, value) assignments
+
+    Returns:
+        Number of cells placed, or -1 if a peer lost all candidates
+    """
+    base = len(trail)
+    queue = [start]
+    placed = 0
+    qi = 0
+    while qi < len(queue):
+        cell = queue[qi]
+        qi += 1
+        for p in PEERS[cell]:
+            if board[p] == 0:
+                mask = (
+                    ~(row_mask[_ROW[p]] | col_mask[_COL[p]] | box_mask[_BOX[p]])
+                    & 0x1FF
+                )
+                if mask == 0:
+                    # Contradiction: roll back this pass's placements so
+                    # the caller's empties count stays consistent
+                    while len(trail) > base:
+                        q = trail.pop()
+                        keep = ~(1 << (board[q] - 1))
+                        board[q] = 0
+                        row_mask[_ROW[q]] &= keep
+                        col_mask[_COL[q]] &= keep
+                        box_mask[_BOX[q]] &= keep
+                    return -1
+                if mask & (mask - 1) == 0:
+                    # Forced cell; assign it and examine its peers too
+                    board[p] = mask.bit_length()
+                    row_mask[_ROW[p]] |= mask
+                    col_mask[_COL[p]] |= mask
+                    box_mask[_BOX[p]] |= mask
+                    trail.append(p)
+                    steps.append((_ROW[p], _COL[p], board[p]))
+                    placed += 1
+                    queue.append(p)
+    return placed
+
+
+def _search(
+    board: List[int],
+    row_mask: List[int],
+    col_mask: List[int],
+    box_mask: List[int],
+    empties: int,
+    steps: List[Tuple[int, int, int]],
+    stats: List[int],
+) -> bool:
+    """
+    Iterative MRV search kernel over a flat board and placed-digit masks.
+
+    row_mask/col_mask/box_mask hold the digits already placed per unit
+    (bit d-1 = digit d), so a cell's candidates are a single
+    ~(row|col|box) & 0x1FF expression; there is no per-cell candidate
+    state to copy or undo. Hitting an empty cell with no candidates fails
+    the node immediately (forward checking). The search tree is walked
+    with an explicit frame stack of [cell, untried-bit list, trail-mark]
+    entries instead of recursion, cutting the per-node Python call
+    overhead and sidestepping the recursion limit. Every guess is
+    followed by _propagate, so only genuinely ambiguous cells cost a
+    search node; forced chains are played and unwound through the trail.
+    When a cell has several candidates they are tried least-constraining
+    first: the digit appearing in the fewest peer candidate masks is
+    likeliest to leave a solvable subtree, so the first branch succeeds
+    more often.
+
+    Args:
+        board: Flat 81-entry board values, 0 for empty
+        row_mask: Digits placed per row
+        col_mask: Digits placed per column
+        box_mask: Digits placed per box
+        empties: Number of empty cells remaining
+        steps: Output list of (row, col, value) assignments
+        stats: Two-entry [guesses, backtracks] accumulator
+
+    Returns:
+        True if the current state leads to a solution, False otherwise
+    """
+    # One frame per guess: [cell index, untried candidate bits in
+    # reverse try order (pop() yields the next), trail mark]
+    stack: List[list] = []
+    # Cells placed by propagation, across all depths; frames record how
+    # long the trail was when they were pushed
+    trail: List[int] = []
+    failed = False
+
+    while True:
+        if failed:
+            # Dead end: unwind to the deepest frame with untried candidates
+            while stack:
+                frame = stack[-1]
+
+                # Undo this frame's propagated placements, newest first
+                mark = frame[2]
+                while len(trail) > mark:
+                    p = trail.pop()
+                    keep = ~(1 << (board[p] - 1))
+                    board[p] = 0
+                    row_mask[_ROW[p]] &= keep
+                    col_mask[_COL[p]] &= keep
+                    box_mask[_BOX[p]] &= keep
+                    empties += 1
+
+                # Undo the guess itself: one AND per unit mask
+                idx = frame[0]
+                keep = ~(1 << (board[idx] - 1))
+                board[idx] = 0
+                row_mask[_ROW[idx]] &= keep
+                col_mask[_COL[idx]] &= keep
+                box_mask[_BOX[idx]] &= keep
+                empties += 1
+                stats[1] += 1
+
+                bits = frame[1]
+                if not bits:
+                    stack.pop()
+                    continue
+
+                # Resume this frame with its next candidate
+                bit = bits.pop()
+                board[idx] = bit.bit_length()
+                steps.append((_ROW[idx], _COL[idx], board[idx]))
+                stats[0] += 1
+                row_mask[_ROW[idx]] |= bit
+                col_mask[_COL[idx]] |= bit
+                box_mask[_BOX[idx]] |= bit
+                empties -= 1
+
+                delta = _propagate(
+                    board, row_mask, col_mask, box_mask, idx, trail, steps
+                )
+                if delta >= 0:
+                    empties -= delta
+                    failed = False
+                # On contradiction the next unwind pass rolls this
+                # attempt back through the same frame
+                break
+            else:
+                return False
+            continue
+
+        if empties == 0:
+            # Every placement was legal, so the board is solved; the
+            # counter replaces any full-board rescan in the base case
+            return True
+
+        # Select the empty cell with fewest candidates (MRV)
+        best = -1
+        best_mask = 0
+        min_count = 10
+        for idx in range(81):
+            if board[idx] == 0:
+                mask = (
+                    ~(row_mask[_ROW[idx]] | col_mask[_COL[idx]] | box_mask[_BOX[idx]])
+                    & 0x1FF
+                )
+                if mask == 0:
+                    # Some empty cell can't be filled = contradiction
+                    best = -1
+                    break
+                count = mask.bit_count()
+                if count < min_count:
+                    min_count = count
+                    best = idx
+                    best_mask = mask
+                    if count == 1:
+                        # Forced cell; can't do better
+                        break
+
+        if best < 0:
+            failed = True
+            continue
+
+        if min_count == 1:
+            # Forced cell: nothing to order, nothing left untried
+            bit = best_mask
+            untried: List[int] = []
+        else:
+            # Least-constraining value: score each candidate digit by how
+            # many peer candidate masks still contain it, then try low
+            # scores first (ties fall to the smaller digit)
+            peer_masks = []
+            for p in PEERS[best]:
+                if board[p] == 0:
+                    peer_masks.append(
+                        ~(row_mask[_ROW[p]] | col_mask[_COL[p]] | box_mask[_BOX[p]])
+                        & 0x1FF
+                    )
+            scored = []
+            mask = best_mask
+            while mask:
+                b = mask & -mask
+                mask ^= b
+                score = 0
+                for pm in peer_masks:
+                    if pm & b:
+                        score += 1
+                scored.append((score, b))
+            # Reverse order so list.pop() yields the least constraining next
+            scored.sort(reverse=True)
+            untried = [b for _, b in scored]
+            bit = untried.pop()
+
+        # Descend: place the chosen candidate, remember the rest
+        stack.append([best, untried, len(trail)])
+        board[best] = bit.bit_length()
+        steps.append((_ROW[best], _COL[best], board[best]))
+        stats[0] += 1
+        row_mask[_ROW[best]] |= bit
+        col_mask[_COL[best]] |= bit
+        box_mask[_BOX[best]] |= bit
+        empties -= 1
+
+        delta = _propagate(board, row_mask, col_mask, box_mask, best, trail, steps)
+        if delta >= 0:
+            empties -= delta
+        else:
+            failed = True
+
+
+def _solve_flat(flat_board: List[int]) -> Optional[List[int]]:
+    """
+    Solve one flat 81-entry board in place with the MRV kernel.
+
+    Args:
+        flat_board: Flat 81-entry board values, 0 for empty
+
+    Returns:
+        The solved board, or None if the puzzle has no solution
+    """
+    masks = _seed_masks(flat_board)
+    if masks is None:
+        return None
+    row_mask, col_mask, box_mask = masks
+
+    steps: List[Tuple[int, int, int]] = []
+    stats = [0, 0]
+    if _search(
+        flat_board, row_mask, col_mask, box_mask, flat_board.count(0), steps, stats
+    ):
+        return flat_board
+    return None
+
+
+def solve_many(boards, max_workers: Optional[int] = None) -> np.ndarray:
+    """
+    Solve a batch of puzzles without the per-instance solver machinery.
+
+    Intended for corpus benchmarking and data generation, where board
+    objects, candidate sets and step history per puzzle are pure
+    overhead: each row runs straight through the MRV kernel on a flat
+    list, and large batches can be spread over a process pool.
+
+    Args:
+        boards: (N, 81) or (N, 9, 9) array-like of cell values, 0 empty
+        max_workers: If given, split the batch across this many processes
+
+    Returns:
+        np.int8 array of shape (N, 81); rows with no solution are
+        returned unchanged
+    """
+    arr = np.asarray(boards, dtype=np.int8).reshape(-1, 81)
+    flats = arr.tolist()
+
+    if max_workers and len(flats) > 1:
+        # Chunked map keeps pickling amortized over many tiny tasks
+        chunksize = max(1, len(flats) // (max_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            solutions = list(pool.map(_solve_flat, flats, chunksize=chunksize))
+    else:
+        solutions = [_solve_flat(flat) for flat in flats]
+
+    out = arr.copy()
+    for i, solution in enumerate(solutions):
+        if solution is not None:
+            out[i] = solution
+    return out
+
+
+def _solve_branch(
+    flat_board: List[int],
+) -> Optional[Tuple[List[int], List[Tuple[int, int, int]], List[int]]]:
+    """
+    Worker for solve_parallel: run the kernel on one speculative branch.
+
+    Args:
+        flat_board: Flat 81-entry board with the branch's guess applied
+
+    Returns:
+        (solved board, steps, [guesses, backtracks]) or None if the
+        branch is unsatisfiable
+    """
+    masks = _seed_masks(flat_board)
+    if masks is None:
+        return None
+    row_mask, col_mask, box_mask = masks
+
+    steps: List[Tuple[int, int, int]] = []
+    stats = [0, 0]
+    if _search(
+        flat_board, row_mask, col_mask, box_mask, flat_board.count(0), steps, stats
+    ):
+        return flat_board, steps, stats
+    return None
+
 
 class BacktrackingMRVSolver(SudokuSolver):
     """
@@ -13,8 +388,13 @@ class BacktrackingMRVSolver(SudokuSolver):
 
     Selects the cell with fewest possible values, reducing branching factor.
     Much faster than basic backtracking on hard puzzles.
+
+    The search itself runs in the _search kernel on flat bitmask arrays;
+    this class marshals the board in and out and keeps the statistics.
     """
 
+    __slots__ = ()
+
     def solve(self) -> bool:
         """
         Solve using backtracking with MRV heuristic.
@@ -22,117 +402,131 @@ class BacktrackingMRVSolver(SudokuSolver):
         Returns:
             True if solved, False if no solution exists
         """
-        return self._solve_recursive()
+        flat_board = [v for row in self.board.board for v in row]
 
-    def _solve_recursive(self) -> bool:
+        # Digits already placed per row/column/box; a conflict among the
+        # givens means there is nothing to search
+        masks = _seed_masks(flat_board)
+        if masks is None:
+            return False
+        row_mask, col_mask, box_mask = masks
+
+        steps: List[Tuple[int, int, int]] = []
+        stats = [0, 0]
+        solved = _search(
+            flat_board,
+            row_mask,
+            col_mask,
+            box_mask,
+            flat_board.count(0),
+            steps,
+            stats,
+        )
+
+        self.step_history.extend(steps)
+        self.cells_assigned += len(steps)
+        self.guesses += stats[0]
+        self.backtracks += stats[1]
+
+        if solved:
+            board = self.board.board
+            for idx, value in enumerate(flat_board):
+                board[idx // 9][idx % 9] = value
+
+        return solved
+
+    def solve_parallel(self, max_workers: Optional[int] = None) -> bool:
         """
-        Recursive backtracking solver with MRV cell selection.
+        Solve by racing the top-level MRV branches across processes.
+
+        The first guess splits the search tree into independent subtrees,
+        one per candidate of the most constrained cell; each runs the
+        kernel in its own process and the first success wins. Process
+        startup costs milliseconds while this corpus solves in
+        microseconds, so this only pays off for genuinely hard boards;
+        solve() remains the default path.
+
+        Args:
+            max_workers: Process pool size; defaults to one per branch
 
         Returns:
-            True if current state leads to solution, False otherwise
+            True if solved, False if no solution exists
         """
-        # Check if solved
-        if self.board.is_solved():
-            return True
+        flat_board = [v for row in self.board.board for v in row]
 
-        # Select best cell (MRV heuristic)
-        cell = self._select_best_cell()
-        if cell is None:
-            # No empty cells but not solved = contradiction
+        masks = _seed_masks(flat_board)
+        if masks is None:
             return False
+        row_mask, col_mask, box_mask = masks
 
-        row, col = cell
-        candidates = self.board.get_candidates(row, col)
-        if not candidates:
-            # No valid candidates for this cell = contradiction
-            return False
-        
-        # time.sleep(0.1)
-        # Try each candidate value
-        for value in sorted(candidates):
-            # Place value
-            self.board.board[row][col] = value
-            self._record_assignment(row, col, value)
-            self.guesses += 1
-
-            # Update candidates for peers
-            old_candidates = copy.deepcopy(self.board.candidates)
-            self.board.candidates[row][col] = set()
-            self.board._remove_candidates_for_value(row, col, value)
-
-            # Recurse
-            if self._solve_recursive():
-                return True
-
-            # Backtrack
-            self.board.board[row][col] = 0
-            self.board.candidates = old_candidates
-            # Restore candidates (simplified - just reinitialize for cell)
-            #self._restore_candidates_on_backtrack(row, col, value)
-            self.backtracks += 1
-
-        return False
-
-    def _select_best_cell(self) -> Optional[Tuple[int, int]]:
-        """
-        Select the empty cell with minimum remaining values (MRV heuristic).
+        # Pick the branching cell exactly as the kernel would (MRV)
+        best = -1
+        best_mask = 0
+        min_count = 10
+        for idx in range(81):
+            if flat_board[idx] == 0:
+                mask = (
+                    ~(row_mask[_ROW[idx]] | col_mask[_COL[idx]] | box_mask[_BOX[idx]])
+                    & 0x1FF
+                )
+                if mask == 0:
+                    return False
+                count = mask.bit_count()
+                if count < min_count:
+                    min_count = count
+                    best = idx
+                    best_mask = mask
+                    if count == 1:
+                        break
 
-        Returns:
-            Tuple of (row, col) for best cell, or None if no empty cells
-        """
-        best_cell = None
-        min_candidates = 10
+        if best < 0:
+            # No empty cells left
+            return self.board.is_solved()
+        if min_count == 1:
+            # A single branch gains nothing from a pool
+            return self.solve()
 
-        for r in range(9):
-            for c in range(9):
-                if self.board.board[r][c] == 0:
-                    num_candidates = len(self.board.candidates[r][c])
-                    if num_candidates < min_candidates:
-                        min_candidates = num_candidates
-                        best_cell = (r, c)
+        # One speculative branch per candidate of the chosen cell
+        branches = []
+        mask = best_mask
+        while mask:
+            bit = mask & -mask
+            mask ^= bit
+            branch = flat_board[:]
+            branch[best] = bit.bit_length()
+            branches.append(branch)
 
-        return best_cell
+        winner = None
+        with ProcessPoolExecutor(
+            max_workers=max_workers or len(branches)
+        ) as pool:
+            pending = {pool.submit(_solve_branch, b) for b in branches}
+            while pending and winner is None:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    if result is not None:
+                        winner = result
+                        break
+            # Losing branches are tiny subtrees; let cancel trim the
+            # not-yet-started ones and shutdown reap the rest
+            for future in pending:
+                future.cancel()
 
-    def _restore_candidates_on_backtrack(self, row: int, col: int, value: int) -> None:
-        """
-        Restore candidates after backtracking (simplified approach).
+        if winner is None:
+            return False
 
-        Args:
-            row: Row index
-            col: Column index
-            value: Value that was removed
-        """
-        # Recalculate candidates for this cell
-        # self.board.candidates[row][col] = set(range(1, 10))
-
-        # Remove values in row, column, and box
-        # for c in range(9):
-        #     if c != col and self.board.board[row][c] != 0:
-        #         self.board.candidates[row][col].discard(self.board.board[row][c])
-
-        # for r in range(9):
-        #     if r != row and self.board.board[r][col] != 0:
-        #         self.board.candidates[row][col].discard(self.board.board[r][col])
-
-        # box_row = (row // 3) * 3
-        # box_col = (col // 3) * 3
-        # for r in range(box_row, box_row + 3):
-        #     for c in range(box_col, box_col + 3):
-        #         if (r != row or c != col) and self.board.board[r][c] != 0:
-        #             self.board.candidates[row][col].discard(self.board.board[r][c])
-        for c in range(self.board.GRID_SIZE):
-            if c != col:
-                self.board.candidates[row][c].add(value)
-
-        # Remove from column peers
-        for r in range(self.board.GRID_SIZE):
-            if r != row:
-                self.board.candidates[r][col].add(value)
-
-        # Remove from box peers
-        box_row = (row // self.board.BOX_SIZE) * self.board.BOX_SIZE
-        box_col = (col // self.board.BOX_SIZE) * self.board.BOX_SIZE
-        for r in range(box_row, box_row + self.board.BOX_SIZE):
-            for c in range(box_col, box_col + self.board.BOX_SIZE):
-                if r != row or c != col:
-                    self.board.candidates[r][c].add(value)
+        solved_board, steps, stats = winner
+        self._record_assignment(
+            best // 9, best % 9, solved_board[best]
+        )
+        self.guesses += 1 + stats[0]
+        self.backtracks += stats[1]
+        self.step_history.extend(steps)
+        self.cells_assigned += len(steps)
+
+        board = self.board.board
+        for idx, value in enumerate(solved_board):
+            board[idx // 9][idx % 9] = value
+
+        return True
@@ -1,41 +1,32 @@
 """Dancing Links algorithm (Knuth's Algorithm X) for Sudoku."""
 
+from typing import List
+
+from ..core.peers import BOX_OF
 from ..core.solver_base import SudokuSolver
 from ..core.sudoku import SudokuBoard
 
 
-class Node:
-    """A node in the doubly-linked list matrix."""
-
-    def __init__(self):
-        """Initialize a node."""
-        self.left = self
-        self.right = self
-        self.up = self
-        self.down = self
-        self.column = None
-        self.row_id = None  # For data rows only
-
-
-class Column:
-    """Column header in the dancing links matrix."""
-
-    def __init__(self, constraint_id):
-        """Initialize column header."""
-        self.node = Node()
-        self.node.column = self
-        self.size = 0
-        self.constraint_id = constraint_id  # (type, value) e.g., ('cell', r, c)
-
-
 class DancingLinksSolver(SudokuSolver):
     """
     Dancing Links algorithm (Algorithm X) for Sudoku solving.
 
     Uses Knuth's Algorithm X with double-ended doubly-linked lists.
     Extremely efficient for constraint satisfaction problems like Sudoku.
+
+    The matrix is stored struct-of-arrays style: parallel lists L/R/U/D
+    hold the links as integer node ids (0 is the root, 1-324 the column
+    headers, then four data nodes per candidate placement), with COL
+    mapping nodes to their column and SIZE tracking column populations.
+    Pointer chases are list indexing instead of attribute lookups on
+    ~3000 node objects, which also keeps the whole matrix in a handful
+    of contiguous allocations.
     """
 
+    __slots__ = ("solution", "L", "R", "U", "D", "COL", "ROW_ID", "SIZE")
+
+    N_COLS = 324
+
     def __init__(self, board: SudokuBoard):
         """Initialize solver."""
         super().__init__(board)
@@ -43,195 +34,180 @@ class DancingLinksSolver(SudokuSolver):
         # This ensures the solution is written to the board passed by the user
         self.board = board
         self.original_board = board.copy()
-        self.columns = []
-        self.column_map = {}
-        self.header = None
-        self.solution = []
-        self.placement_rows = {}
+        self.solution: List[int] = []
         self._prepare_matrix()
 
+    @staticmethod
+    def _row_node(r: int, c: int, d: int) -> int:
+        """First node id of the placement row for digit d at (r, c)."""
+        return 325 + ((r * 9 + c) * 9 + d - 1) * 4
+
     def _prepare_matrix(self):
         """Prepare the sparse matrix for Algorithm X."""
-        # Create header node
-        self.header = Node()
-
-        # Create 324 constraint columns
-        for r in range(9):
-            for c in range(9):
-                col = Column(("cell", r, c))
-                self.columns.append(col)
-                self.column_map[("cell", r, c)] = col
-                col.node.right = self.header
-                col.node.left = self.header.left
-                self.header.left.right = col.node
-                self.header.left = col.node
-
-        for r in range(9):
-            for d in range(1, 10):
-                col = Column(("row", r, d))
-                self.columns.append(col)
-                self.column_map[("row", r, d)] = col
-                col.node.right = self.header
-                col.node.left = self.header.left
-                self.header.left.right = col.node
-                self.header.left = col.node
-
-        for c in range(9):
-            for d in range(1, 10):
-                col = Column(("col", c, d))
-                self.columns.append(col)
-                self.column_map[("col", c, d)] = col
-                col.node.right = self.header
-                col.node.left = self.header.left
-                self.header.left.right = col.node
-                self.header.left = col.node
-
-        for b in range(9):
-            for d in range(1, 10):
-                col = Column(("box", b, d))
-                self.columns.append(col)
-                self.column_map[("box", b, d)] = col
-                col.node.right = self.header
-                col.node.left = self.header.left
-                self.header.left.right = col.node
-                self.header.left = col.node
-
-        # Create rows for all possible placements
+        n_nodes = 1 + self.N_COLS + 729 * 4
+
+        L = [0] * n_nodes
+        R = [0] * n_nodes
+        U = [0] * n_nodes
+        D = [0] * n_nodes
+        COL = [0] * n_nodes
+        ROW_ID = [-1] * n_nodes
+        SIZE = [0] * (self.N_COLS + 1)
+
+        # Root (id 0) and the 324 column headers form a horizontal ring;
+        # every column starts as an empty vertical ring.
+        # Column layout: 1-81 cell(r,c), 82-162 row(r,d), 163-243 col(c,d),
+        # 244-324 box(b,d)
+        for col in range(self.N_COLS + 1):
+            L[col] = col - 1 if col else self.N_COLS
+            R[col] = (col + 1) % (self.N_COLS + 1)
+            U[col] = col
+            D[col] = col
+            COL[col] = col
+
+        node = self.N_COLS + 1
         for r in range(9):
             for c in range(9):
                 for d in range(1, 10):
-                    nodes = []
-
-                    # Cell constraint
-                    cell_col = self.column_map[("cell", r, c)]
-                    cell_node = self._add_node(cell_col)
-                    nodes.append(cell_node)
-
-                    # Row constraint
-                    row_col = self.column_map[("row", r, d)]
-                    row_node = self._add_node(row_col)
-                    nodes.append(row_node)
-
-                    # Column constraint
-                    col_col = self.column_map[("col", c, d)]
-                    col_node = self._add_node(col_col)
-                    nodes.append(col_node)
-
-                    # Box constraint
-                    box = (r // 3) * 3 + (c // 3)
-                    box_col = self.column_map[("box", box, d)]
-                    box_node = self._add_node(box_col)
-                    nodes.append(box_node)
-
-                    # Link row nodes horizontally (circular)
-                    for i, node in enumerate(nodes):
-                        node.left = nodes[i - 1]
-                        node.right = nodes[(i + 1) % len(nodes)]
-
-                    # Store placement for reference
-                    self.placement_rows[(r, c, d)] = nodes[0]
-
-    def _add_node(self, column):
-        """Add a node to a column."""
-        node = Node()
-        node.column = column
-
-        # Add to column (insert before header)
-        node.up = column.node.up
-        node.down = column.node
-        column.node.up.down = node
-        column.node.up = node
-
-        column.size += 1
-        return node
-
-    def _cover(self, column):
+                    cols = (
+                        1 + r * 9 + c,
+                        82 + r * 9 + d - 1,
+                        163 + c * 9 + d - 1,
+                        244 + BOX_OF[r * 9 + c] * 9 + d - 1,
+                    )
+                    row_id = (r * 9 + c) * 9 + d - 1
+                    first = node
+                    for i, col in enumerate(cols):
+                        COL[node] = col
+                        ROW_ID[node] = row_id
+
+                        # Insert at the bottom of the column
+                        U[node] = U[col]
+                        D[node] = col
+                        D[U[col]] = node
+                        U[col] = node
+                        SIZE[col] += 1
+
+                        # Link row nodes horizontally (circular)
+                        L[node] = first + (i - 1) % 4
+                        R[node] = first + (i + 1) % 4
+                        node += 1
+
+        self.L = L
+        self.R = R
+        self.U = U
+        self.D = D
+        self.COL = COL
+        self.ROW_ID = ROW_ID
+        self.SIZE = SIZE
+
+    def _cover(self, col: int) -> None:
         """Cover a column and all conflicting rows."""
-        column.node.right.left = column.node.left
-        column.node.left.right = column.node.right
+        L, R, U, D = self.L, self.R, self.U, self.D
+        COL, SIZE = self.COL, self.SIZE
+
+        L[R[col]] = L[col]
+        R[L[col]] = R[col]
 
-        cur = column.node.down
-        while cur != column.node:
-            node = cur.right
+        cur = D[col]
+        while cur != col:
+            node = R[cur]
             while node != cur:
-                node.column.size -= 1
-                node.down.up = node.up
-                node.up.down = node.down
-                node = node.right
-            cur = cur.down
+                SIZE[COL[node]] -= 1
+                U[D[node]] = U[node]
+                D[U[node]] = D[node]
+                node = R[node]
+            cur = D[cur]
 
-    def _uncover(self, column):
+    def _uncover(self, col: int) -> None:
         """Uncover a column (reverse of cover)."""
-        cur = column.node.up
-        while cur != column.node:
-            node = cur.left
+        L, R, U, D = self.L, self.R, self.U, self.D
+        COL, SIZE = self.COL, self.SIZE
+
+        cur = U[col]
+        while cur != col:
+            node = L[cur]
             while node != cur:
-                node.column.size += 1
-                node.down.up = node
-                node.up.down = node
-                node = node.left
-            cur = cur.up
+                SIZE[COL[node]] += 1
+                U[D[node]] = node
+                D[U[node]] = node
+                node = L[node]
+            cur = U[cur]
 
-        column.node.right.left = column.node
-        column.node.left.right = column.node
+        L[R[col]] = col
+        R[L[col]] = col
 
-    def _select_column(self):
+    def _select_column(self) -> int:
         """Select column with minimum size (heuristic)."""
-        min_size = float("inf")
-        min_col = None
-
-        node = self.header.right
-        while node != self.header:
-            if node.column.size < min_size:
-                min_size = node.column.size
-                min_col = node.column
-            node = node.right
+        R, SIZE = self.R, self.SIZE
+
+        min_size = 10
+        min_col = 0
+
+        col = R[0]
+        while col:
+            size = SIZE[col]
+            if size < min_size:
+                if size == 0:
+                    # Unsatisfiable column: stop scanning, the caller
+                    # fails this node immediately
+                    return col
+                min_size = size
+                min_col = col
+            col = R[col]
 
         return min_col
 
-    def _search(self):
-        """Recursive search using Algorithm X."""
-        # Check if solved
-        if self.header.right == self.header:
-            return True
-
-        # Select column with minimum size
-        col = self._select_column()
+    def _search(self) -> bool:
+        """Iterative search using Algorithm X.
 
-        if col.size == 0:
-            return False
+        The depth-first walk keeps an explicit stack of (column, row node)
+        pairs instead of recursing, so a node costs a few list ops rather
+        than a Python call frame and deep searches can't hit the
+        recursion limit.
+        """
+        L, R, D = self.L, self.R, self.D
+        stack: List[tuple] = []
 
-        self._cover(col)
+        while True:
+            # Check if solved: the header ring is empty
+            if R[0] == 0:
+                return True
 
-        # Try each row in the column
-        cur = col.node.down
-        while cur != col.node:
+            # Select column with minimum size
+            col = self._select_column()
+            cur = col
+            if self.SIZE[col]:
+                self._cover(col)
+                cur = D[col]
+
+            # cur == col means this column has no rows left to try
+            while cur == col:
+                if self.SIZE[col]:
+                    self._uncover(col)
+                if not stack:
+                    return False
+
+                # Backtrack: undo the previous row choice and advance it
+                col, cur = stack.pop()
+                self.solution.pop()
+                self.backtracks += 1
+
+                node = L[cur]
+                while node != cur:
+                    self._uncover(self.COL[node])
+                    node = L[node]
+
+                cur = D[cur]
+
+            # Descend into row cur: cover all its other columns
             self.solution.append(cur)
-
-            # Cover all columns in this row
-            node = cur.right
+            node = R[cur]
             while node != cur:
-                self._cover(node.column)
-                node = node.right
-
+                self._cover(self.COL[node])
+                node = R[node]
             self.guesses += 1
-
-            if self._search():
-                return True
-
-            # Uncover columns (backtrack)
-            self.solution.pop()
-            self.backtracks += 1
-
-            node = cur.left
-            while node != cur:
-                self._uncover(node.column)
-                node = node.left
-
-            cur = cur.down
-
-        self._uncover(col)
-        return False
+            stack.append((col, cur))
 
     def solve(self) -> bool:
         """
@@ -243,17 +219,16 @@ class DancingLinksSolver(SudokuSolver):
         # Handle pre-filled cells by forcing their selection
         for r in range(9):
             for c in range(9):
-                if self.board.board[r][c] != 0:
-                    d = self.board.board[r][c]
-                    if (r, c, d) in self.placement_rows:
-                        row_node = self.placement_rows[(r, c, d)]
-                        self.solution.append(row_node)
-
-                        # Cover all 4 constraints for this placement
-                        node = row_node
-                        for _ in range(4):
-                            self._cover(node.column)
-                            node = node.right
+                d = self.board.board[r][c]
+                if d != 0:
+                    row_node = self._row_node(r, c, d)
+                    self.solution.append(row_node)
+
+                    # Cover all 4 constraints for this placement
+                    node = row_node
+                    for _ in range(4):
+                        self._cover(self.COL[node])
+                        node = self.R[node]
 
         # Run the recursive search algorithm
         success = self._search()
@@ -261,36 +236,26 @@ class DancingLinksSolver(SudokuSolver):
         if success:
             # Extract solution from all selected rows
             for row_node in self.solution:
-                # Traverse the 4 nodes in this row
-                r, c, d = None, None, None
-                node = row_node
-                for _ in range(4):
-                    constraint_type = node.column.constraint_id[0]
-                    if constraint_type == "cell":
-                        r = node.column.constraint_id[1]
-                        c = node.column.constraint_id[2]
-                    elif constraint_type == "row":
-                        d = node.column.constraint_id[2]
-                    node = node.right
-
-                # Set the cell value if we found valid r, c, d
-                if r is not None and c is not None and d is not None:
-                    self.board.board[r][c] = d
-                    self._record_assignment(r, c, d)
+                row_id = self.ROW_ID[row_node]
+                cell, d = divmod(row_id, 9)
+                r, c = divmod(cell, 9)
+                self.board.board[r][c] = d + 1
+                self._record_assignment(r, c, d + 1)
 
         return success
 
     def reset(self) -> None:
-        """Reset solver to initial state and rebuild the matrix structure."""
+        """Reset solver to initial state, restoring the matrix in place."""
         # Call parent's reset to reset board and statistics
         super().reset()
-        
-        # Reset solver-specific state
+
+        # Every selected row (clue or search pick) covered its four columns
+        # starting at the stored node; uncovering in exact reverse returns
+        # the matrix to pristine state without reallocating ~3000 nodes
+        for row_node in reversed(self.solution):
+            node = self.L[row_node]
+            for _ in range(4):
+                self._uncover(self.COL[node])
+                node = self.L[node]
+
         self.solution = []
-        
-        # Rebuild the matrix structure
-        self.columns = []
-        self.column_map = {}
-        self.header = None
-        self.placement_rows = {}
-        self._prepare_matrix()
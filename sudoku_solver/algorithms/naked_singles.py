@@ -1,5 +1,6 @@
 """Naked singles constraint propagation algorithm."""
 
+from ..core.peers import BOX_OF, PEERS
 from ..core.solver_base import SudokuSolver
 
 
@@ -9,8 +10,17 @@ class NakedSinglesSolver(SudokuSolver):
 
     Fast for easy-medium puzzles but gets stuck on hard puzzles.
     No backtracking - pure constraint propagation.
+
+    Candidates are tracked as 9-bit masks in a flat list (bit d-1 set means
+    digit d is allowed), so elimination is a single AND per peer and the
+    naked-single test is a power-of-two check instead of set operations.
     """
 
+    __slots__ = ("_candidates",)
+
+    #: Bitmask with bits 0-8 set: all nine digits allowed
+    ALL_DIGITS = 0x1FF
+
     def solve(self) -> bool:
         """
         Solve using naked singles constraint propagation.
@@ -32,7 +42,7 @@ class NakedSinglesSolver(SudokuSolver):
                 for row, col, value in naked_singles:
                     if self.board.board[row][col] == 0:
                         self.board.board[row][col] = value
-                        self.board.candidates[row][col] = set()
+                        self._candidates[row * 9 + col] = 0
                         self._record_assignment(row, col, value)
                         self._eliminate_candidates(row, col, value)
 
@@ -40,33 +50,41 @@ class NakedSinglesSolver(SudokuSolver):
         return self.board.is_solved()
 
     def _initialize_candidates(self) -> None:
-        """Initialize candidates for all cells."""
-        self.board.candidates = [[set() for _ in range(9)] for _ in range(9)]
+        """Initialize candidate bitmasks for all cells."""
+        board = self.board.board
 
+        # Digits already used per row, column and box
+        row_used = [0] * 9
+        col_used = [0] * 9
+        box_used = [0] * 9
         for r in range(9):
+            row_values = board[r]
+            base = r * 9
             for c in range(9):
-                if self.board.board[r][c] == 0:
-                    candidates = set(range(1, 10))
-
-                    # Remove values in row
-                    for col in range(9):
-                        if self.board.board[r][col] != 0:
-                            candidates.discard(self.board.board[r][col])
-
-                    # Remove values in column
-                    for row in range(9):
-                        if self.board.board[row][c] != 0:
-                            candidates.discard(self.board.board[row][c])
-
-                    # Remove values in box
-                    box_r = (r // 3) * 3
-                    box_c = (c // 3) * 3
-                    for row in range(box_r, box_r + 3):
-                        for col in range(box_c, box_c + 3):
-                            if self.board.board[row][col] != 0:
-                                candidates.discard(self.board.board[row][col])
-
-                    self.board.candidates[r][c] = candidates
+                value = row_values[c]
+                if value != 0:
+                    bit = 1 << (value - 1)
+                    row_used[r] |= bit
+                    col_used[c] |= bit
+                    box_used[BOX_OF[base + c]] |= bit
+
+        # Combine the unit masks per cell; bind the row-level lookups once
+        # per row so the inner loop is pure integer ops
+        candidates = []
+        all_digits = self.ALL_DIGITS
+        for r in range(9):
+            row_values = board[r]
+            row_bits = row_used[r]
+            base = r * 9
+            for c in range(9):
+                if row_values[c] != 0:
+                    candidates.append(0)
+                else:
+                    candidates.append(
+                        all_digits
+                        & ~(row_bits | col_used[c] | box_used[BOX_OF[base + c]])
+                    )
+        self._candidates = candidates
 
     def _eliminate_candidates(self, row: int, col: int, value: int) -> None:
         """
@@ -77,23 +95,12 @@ class NakedSinglesSolver(SudokuSolver):
             col: Column index
             value: Value that was assigned
         """
-        # Remove from row
-        for c in range(9):
-            if c != col:
-                self.board.candidates[row][c].discard(value)
-
-        # Remove from column
-        for r in range(9):
-            if r != row:
-                self.board.candidates[r][col].discard(value)
+        keep = ~(1 << (value - 1))
+        candidates = self._candidates
 
-        # Remove from box
-        box_r = (row // 3) * 3
-        box_c = (col // 3) * 3
-        for r in range(box_r, box_r + 3):
-            for c in range(box_c, box_c + 3):
-                if r != row or c != col:
-                    self.board.candidates[r][c].discard(value)
+        # One flat pass over the precomputed 20 peers
+        for p in PEERS[row * 9 + col]:
+            candidates[p] &= keep
 
     def _find_naked_singles(self) -> list:
         """
@@ -103,18 +110,22 @@ class NakedSinglesSolver(SudokuSolver):
             List of (row, col, value) tuples for naked singles found
         """
         naked_singles = []
+        candidates = self._candidates
+        board = self.board.board
 
         for r in range(9):
+            base = r * 9
+            row_values = board[r]
             for c in range(9):
-                if self.board.board[r][c] == 0:
-                    candidates = self.board.candidates[r][c]
-                    if len(candidates) == 1:
-                        value = list(candidates)[0]
-                        naked_singles.append((r, c, value))
-                    elif len(candidates) == 0:
+                if row_values[c] == 0:
+                    mask = candidates[base + c]
+                    if mask == 0:
                         # Contradiction - no valid candidates
                         self.board.board = None  # Mark as invalid
                         return []
+                    if mask & (mask - 1) == 0:
+                        # Single bit set; its position is the digit
+                        naked_singles.append((r, c, mask.bit_length()))
 
         return naked_singles
 
@@ -139,7 +150,7 @@ class NakedSinglesSolver(SudokuSolver):
             for row, col, value in naked_singles:
                 if self.board.board[row][col] == 0:
                     self.board.board[row][col] = value
-                    self.board.candidates[row][col] = set()
+                    self._candidates[row * 9 + col] = 0
                     self._record_assignment(row, col, value)
                     self._eliminate_candidates(row, col, value)
                     changed = True
@@ -0,0 +1,60 @@
+"""Canonical registry of solver algorithms.
+
+Stores dotted paths instead of classes so importing the registry (e.g. for
+analyzer-only profiler invocations, or in pool workers that run a single
+algorithm) does not pull in every solver module. Classes are resolved on
+first use and cached.
+"""
+
+from functools import lru_cache
+from importlib import import_module
+from typing import Tuple
+
+ALGORITHM_PATHS: Tuple[Tuple[str, str], ...] = (
+    (
+        "Backtracking",
+        "sudoku_solver.algorithms.backtracking:BacktrackingSolver",
+    ),
+    (
+        "Backtracking + MRV",
+        "sudoku_solver.algorithms.backtracking_mrv:BacktrackingMRVSolver",
+    ),
+    (
+        "Naked Singles",
+        "sudoku_solver.algorithms.naked_singles:NakedSinglesSolver",
+    ),
+    (
+        "Dancing Links",
+        "sudoku_solver.algorithms.dancing_links:DancingLinksSolver",
+    ),
+)
+
+
+@lru_cache(maxsize=None)
+def resolve(name: str) -> type:
+    """
+    Import and return the solver class registered under a display name.
+
+    Args:
+        name: Display name, e.g. "Dancing Links"
+
+    Returns:
+        The solver class; only its module is imported
+
+    Raises:
+        KeyError: If no algorithm is registered under the name
+    """
+    for algo_name, path in ALGORITHM_PATHS:
+        if algo_name == name:
+            module_name, _, class_name = path.partition(":")
+            return getattr(import_module(module_name), class_name)
+    raise KeyError(f"Unknown algorithm: {name}")
+
+
+@lru_cache(maxsize=1)
+def load_algorithms() -> Tuple[Tuple[str, type], ...]:
+    """Resolve the full (name, class) tuple, importing all solver modules."""
+    return tuple((name, resolve(name)) for name, _ in ALGORITHM_PATHS)
+
+
+__all__ = ["ALGORITHM_PATHS", "load_algorithms", "resolve"]
@@ -0,0 +1,44 @@
+"""Precomputed peer and unit index tables for the 9x9 grid.
+
+Cells are addressed by flat index ``row * 9 + col``. Building these tables
+once at import time lets the hot solver loops iterate a flat tuple instead
+of recomputing box origins and skipping the cell itself on every call.
+"""
+
+from typing import Tuple
+
+#: Flat indices of each row, column and box unit
+UNITS_ROW: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(r * 9 + c for c in range(9)) for r in range(9)
+)
+UNITS_COL: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(r * 9 + c for r in range(9)) for c in range(9)
+)
+UNITS_BOX: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple((box_r + r) * 9 + box_c + c for r in range(3) for c in range(3))
+    for box_r in (0, 3, 6)
+    for box_c in (0, 3, 6)
+)
+
+
+def _build_peers() -> Tuple[Tuple[int, ...], ...]:
+    """Build the 20 distinct row/column/box peers of every cell."""
+    peers = []
+    for idx in range(81):
+        r, c = divmod(idx, 9)
+        cell_peers = set(UNITS_ROW[r])
+        cell_peers.update(UNITS_COL[c])
+        cell_peers.update(UNITS_BOX[(r // 3) * 3 + c // 3])
+        cell_peers.discard(idx)
+        peers.append(tuple(sorted(cell_peers)))
+    return tuple(peers)
+
+
+#: PEERS[idx] lists the 20 flat indices sharing a unit with cell idx
+PEERS: Tuple[Tuple[int, ...], ...] = _build_peers()
+
+#: BOX_OF[idx] is the box number of cell idx; one table read replaces
+#: the two integer divisions of (r // 3) * 3 + c // 3
+BOX_OF: bytes = bytes((idx // 27) * 3 + (idx % 9) // 3 for idx in range(81))
+
+__all__ = ["BOX_OF", "PEERS", "UNITS_ROW", "UNITS_COL", "UNITS_BOX"]
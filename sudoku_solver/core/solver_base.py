@@ -2,14 +2,79 @@
 
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterable, Iterator, Tuple, Union
 
 from .sudoku import SudokuBoard
 
 
+class StepHistory:
+    """
+    Compact log of (row, col, value) assignments backed by a bytearray.
+
+    A hard puzzle can record millions of assignments; as a list of
+    3-tuples each costs well over a hundred bytes of tuple and int
+    objects, while here each is three raw bytes appended in one call.
+    Tuples are only materialized when the history is read back for
+    display or replay, through the usual sequence protocol (len,
+    indexing, slicing, iteration).
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self) -> None:
+        self._data = bytearray()
+
+    def append(self, step: Tuple[int, int, int]) -> None:
+        """Record one (row, col, value) assignment."""
+        self._data.extend(step)
+
+    def extend(self, steps: Iterable[Tuple[int, int, int]]) -> None:
+        """Record a batch of (row, col, value) assignments."""
+        data = self._data
+        for step in steps:
+            data.extend(step)
+
+    def __len__(self) -> int:
+        return len(self._data) // 3
+
+    def __bool__(self) -> bool:
+        return bool(self._data)
+
+    def __iter__(self) -> Iterator[Tuple[int, int, int]]:
+        data = self._data
+        for i in range(0, len(data), 3):
+            yield (data[i], data[i + 1], data[i + 2])
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[Tuple[int, int, int], list]:
+        if isinstance(index, slice):
+            start, stop, stride = index.indices(len(self))
+            return [self[i] for i in range(start, stop, stride)]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("step index out of range")
+        i = index * 3
+        data = self._data
+        return (data[i], data[i + 1], data[i + 2])
+
+
 class SudokuSolver(ABC):
     """Abstract base class for all Sudoku solving algorithms."""
 
+    # Slots keep the many short-lived solver instances dict-free;
+    # subclasses declare their own additional attributes
+    __slots__ = (
+        "board",
+        "original_board",
+        "cells_assigned",
+        "backtracks",
+        "guesses",
+        "execution_time_ns",
+        "step_history",
+    )
+
     def __init__(self, board: SudokuBoard):
         """
         Initialize solver with a Sudoku board.
@@ -24,10 +89,14 @@ class SudokuSolver(ABC):
         self.cells_assigned = 0
         self.backtracks = 0
         self.guesses = 0
-        self.execution_time = 0.0
-        self.step_history: List[Tuple[int, int, int]] = (
-            []
-        )  # List of (row, col, value) assignments
+        self.execution_time_ns = 0
+        # Sequence of (row, col, value) assignments, 3 bytes per record
+        self.step_history = StepHistory()
+
+    @property
+    def execution_time(self) -> float:
+        """Solve duration in seconds, derived from the nanosecond count."""
+        return self.execution_time_ns * 1e-9
 
     @abstractmethod
     def solve(self) -> bool:
@@ -67,8 +136,8 @@ class SudokuSolver(ABC):
         self.cells_assigned = 0
         self.backtracks = 0
         self.guesses = 0
-        self.execution_time = 0.0
-        self.step_history = []
+        self.execution_time_ns = 0
+        self.step_history = StepHistory()
 
     def _record_assignment(self, row: int, col: int, value: int) -> None:
         """
@@ -86,10 +155,14 @@ class SudokuSolver(ABC):
         """
         Solve the puzzle with execution time tracking.
 
+        Timing uses the monotonic perf_counter_ns clock: wall-clock time
+        can jump under NTP adjustment and its resolution is too coarse
+        for the sub-millisecond solves the fast algorithms manage.
+
         Returns:
             True if puzzle is solved, False otherwise
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         result = self.solve()
-        self.execution_time = time.time() - start_time
+        self.execution_time_ns = time.perf_counter_ns() - start_ns
         return result
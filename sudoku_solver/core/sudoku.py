@@ -1,12 +1,98 @@
 """Sudoku board representation and validation."""
 
-import copy
-from typing import List, Optional, Set, Tuple
+from array import array
+from typing import Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+from .peers import BOX_OF, PEERS
+
+
+def _clone_board(board):
+    """Shallow-copy a 9x9 grid of immutable ints, row by row."""
+    return [row[:] for row in board]
+
+
+# All nine digits; copied with set() instead of rebuilding via
+# set(range(1, 10)) in per-cell loops
+_ALL_VALUES = frozenset(range(1, 10))
+
+#: Bitmask with bits 0-8 set: all nine digits possible
+_ALL_MASK = 0x1FF
+
+#: Display symbols indexed by cell value; EMPTY renders as a dot
+_SYMBOLS = (".", "1", "2", "3", "4", "5", "6", "7", "8", "9")
+
+#: bytes.translate table mapping cell values 0-9 to their ASCII digits
+_TO_ASCII = bytes.maketrans(bytes(range(10)), b"0123456789")
+
+_ROW_TEMPLATE = "{} {} {} | {} {} {} | {} {} {} "
+
+#: Full pretty-print layout with one placeholder per cell, so rendering
+#: is a single format call instead of per-cell string concatenation
+_BOARD_TEMPLATE = "\n------+-------+------\n".join(
+    "\n".join([_ROW_TEMPLATE] * 3) for _ in range(3)
+)
+
+
+class _CandidateRow:
+    """One row of the candidate grid, decoding bitmasks to sets lazily."""
+
+    __slots__ = ("_masks", "_base")
+
+    def __init__(self, masks: array, base: int):
+        self._masks = masks
+        self._base = base
+
+    def __len__(self) -> int:
+        return 9
+
+    def __getitem__(self, col: int) -> Set[int]:
+        mask = self._masks[self._base + col]
+        return {d + 1 for d in range(9) if mask >> d & 1}
+
+    def __iter__(self) -> Iterator[Set[int]]:
+        for col in range(9):
+            yield self[col]
+
+
+class CandidateGrid:
+    """
+    9x9 view over the flat candidate-mask array.
+
+    candidates[row][col] materializes a set of possible digits on
+    demand; the backing store stays one uint16 bitmask per cell so peer
+    elimination is a bitwise AND instead of set surgery.
+    """
+
+    __slots__ = ("_masks",)
+
+    def __init__(self, masks: array):
+        self._masks = masks
+
+    def __len__(self) -> int:
+        return 9
+
+    def __getitem__(self, row: int) -> _CandidateRow:
+        return _CandidateRow(self._masks, row * 9)
+
+    def __iter__(self) -> Iterator[_CandidateRow]:
+        for row in range(9):
+            yield self[row]
 
 
 class SudokuBoard:
     """Represents a 9x9 Sudoku board with state management and validation."""
 
+    __slots__ = (
+        "board",
+        "initial_board",
+        "_candidate_masks",
+        "_row_used",
+        "_col_used",
+        "_box_used",
+    )
+
     GRID_SIZE = 9
     BOX_SIZE = 3
     EMPTY = 0
@@ -24,53 +110,99 @@ class SudokuBoard:
                 [self.EMPTY for _ in range(self.GRID_SIZE)]
                 for _ in range(self.GRID_SIZE)
             ]
-            self.initial_board = copy.deepcopy(self.board)
+            self.initial_board = _clone_board(self.board)
         else:
             if len(grid) != self.GRID_SIZE or any(
                 len(row) != self.GRID_SIZE for row in grid
             ):
                 raise ValueError("Grid must be 9x9")
             self.board = [row[:] for row in grid]
-            self.initial_board = copy.deepcopy(self.board)
+            self.initial_board = _clone_board(self.board)
 
-        self.candidates = self._initialize_candidates()
+        self._candidate_masks = self._initialize_candidates()
 
-    def _initialize_candidates(self) -> List[List[Set[int]]]:
+    @classmethod
+    def _from_trusted(cls, flat) -> "SudokuBoard":
         """
-        Initialize possible values for each cell.
+        Build a board from a flat 81-entry sequence known to be valid.
+
+        Skips the shape validation of __init__ for callers that already
+        hold well-formed data (snapshots, generator output, solver
+        workers); the candidate masks are still derived in the usual
+        single O(81) pass.
+
+        Args:
+            flat: Sequence of 81 ints (or bytes) in row-major order
 
         Returns:
-            3D structure: candidates[row][col] = set of possible values
+            New SudokuBoard instance
         """
-        candidates = [
-            [
-                (
-                    set(range(1, self.GRID_SIZE + 1))
-                    if self.board[r][c] == self.EMPTY
-                    else set()
-                )
-                for c in range(self.GRID_SIZE)
-            ]
-            for r in range(self.GRID_SIZE)
+        board = cls.__new__(cls)
+        board.board = [
+            list(flat[r * cls.GRID_SIZE : (r + 1) * cls.GRID_SIZE])
+            for r in range(cls.GRID_SIZE)
         ]
+        board.initial_board = _clone_board(board.board)
+        board._candidate_masks = board._initialize_candidates()
+        return board
+
+    @property
+    def candidates(self) -> CandidateGrid:
+        """Candidate digits per cell as a 9x9 grid of sets (decoded lazily)."""
+        return CandidateGrid(self._candidate_masks)
 
-        # Remove values based on initial board state
+    def _initialize_candidates(self) -> array:
+        """
+        Initialize candidate bitmasks for all cells.
+
+        One pass collects the digits used per row, column and box; a
+        second combines them, so the build is O(81) instead of a peer
+        scan per clue. The per-unit masks are kept on the instance and
+        maintained by set_value, making placement-validity checks O(1).
+
+        Returns:
+            Flat array of 81 uint16 masks, bit d-1 set when digit d is
+            possible; filled cells hold 0
+        """
+        row_used = [0] * 9
+        col_used = [0] * 9
+        box_used = [0] * 9
         for r in range(self.GRID_SIZE):
+            row_values = self.board[r]
+            box_row = (r // self.BOX_SIZE) * self.BOX_SIZE
             for c in range(self.GRID_SIZE):
-                if self.board[r][c] != self.EMPTY:
-                    self._remove_candidates_for_value(
-                        r, c, self.board[r][c], candidates
+                value = row_values[c]
+                if value != self.EMPTY:
+                    bit = 1 << (value - 1)
+                    row_used[r] |= bit
+                    col_used[c] |= bit
+                    box_used[box_row + c // self.BOX_SIZE] |= bit
+
+        self._row_used = row_used
+        self._col_used = col_used
+        self._box_used = box_used
+
+        return array(
+            "H",
+            (
+                (
+                    0
+                    if self.board[r][c] != self.EMPTY
+                    else _ALL_MASK
+                    & ~(
+                        row_used[r]
+                        | col_used[c]
+                        | box_used[(r // self.BOX_SIZE) * self.BOX_SIZE + c // self.BOX_SIZE]
                     )
-
-        return candidates
+                )
+                for r in range(self.GRID_SIZE)
+                for c in range(self.GRID_SIZE)
+            ),
+        )
 
     def _remove_candidates_for_value(
-        self,
-        row: int,
-        col: int,
-        value: int,
-        candidates: Optional[List[List[Set[int]]]] = None,
-    ) -> None:
+        self, row: int, col: int, value: int
+    ) -> List[Tuple[int, int]]:
         """
         Remove a value from candidates of all peers of a cell.
 
@@ -78,30 +210,24 @@ class SudokuBoard:
             row: Row index
             col: Column index
             value: Value to remove
-            candidates: Optional candidates structure to update. If None, uses self.candidates
-        """
-        if candidates is None:
-            candidates = self.candidates
-
-        target_candidates = candidates
 
-        # Remove from row peers
-        for c in range(self.GRID_SIZE):
-            if c != col:
-                target_candidates[row][c].discard(value)
+        Returns:
+            List of (row, col) cells the value was actually removed from,
+            usable as an undo log by backtracking solvers
+        """
+        bit = 1 << (value - 1)
+        masks = self._candidate_masks
+        removed = []
 
-        # Remove from column peers
-        for r in range(self.GRID_SIZE):
-            if r != row:
-                target_candidates[r][col].discard(value)
+        # The peer table already excludes the cell itself and holds each
+        # peer exactly once; elimination is one AND per peer
+        for peer in PEERS[row * self.GRID_SIZE + col]:
+            mask = masks[peer]
+            if mask & bit:
+                masks[peer] = mask ^ bit
+                removed.append(divmod(peer, self.GRID_SIZE))
 
-        # Remove from box peers
-        box_row = (row // self.BOX_SIZE) * self.BOX_SIZE
-        box_col = (col // self.BOX_SIZE) * self.BOX_SIZE
-        for r in range(box_row, box_row + self.BOX_SIZE):
-            for c in range(box_col, box_col + self.BOX_SIZE):
-                if r != row or c != col:
-                    target_candidates[r][c].discard(value)
+        return removed
 
     def get_candidates(self, row: int, col: int) -> Set[int]:
         """
@@ -116,7 +242,8 @@ class SudokuBoard:
         """
         if self.board[row][col] != self.EMPTY:
             return set()
-        return self.candidates[row][col].copy()
+        mask = self._candidate_masks[row * self.GRID_SIZE + col]
+        return {d + 1 for d in range(9) if mask >> d & 1}
 
     def set_value(self, row: int, col: int, value: int) -> bool:
         """
@@ -141,30 +268,63 @@ class SudokuBoard:
             if not self._is_valid_placement(row, col, value):
                 return False
 
+        # Maintain the per-unit used-digit masks; BOX_OF replaces the
+        # divide-multiply box arithmetic with one table load
+        idx = row * self.GRID_SIZE + col
+        box = BOX_OF[idx]
+        old = self.board[row][col]
+        if old != self.EMPTY:
+            old_bit = 1 << (old - 1)
+            self._row_used[row] ^= old_bit
+            self._col_used[col] ^= old_bit
+            self._box_used[box] ^= old_bit
+        if value != self.EMPTY:
+            bit = 1 << (value - 1)
+            self._row_used[row] |= bit
+            self._col_used[col] |= bit
+            self._box_used[box] |= bit
+
         self.board[row][col] = value
 
         # Update candidates
         if value == self.EMPTY:
-            self.candidates[row][col] = set(range(1, self.GRID_SIZE + 1))
-            # Recalculate candidates (simplified - remove values in row/col/box)
-            for c in range(self.GRID_SIZE):
-                if c != col and self.board[row][c] != self.EMPTY:
-                    self.candidates[row][col].discard(self.board[row][c])
-            for r in range(self.GRID_SIZE):
-                if r != row and self.board[r][col] != self.EMPTY:
-                    self.candidates[row][col].discard(self.board[r][col])
-            box_row = (row // self.BOX_SIZE) * self.BOX_SIZE
-            box_col = (col // self.BOX_SIZE) * self.BOX_SIZE
-            for r in range(box_row, box_row + self.BOX_SIZE):
-                for c in range(box_col, box_col + self.BOX_SIZE):
-                    if (r != row or c != col) and self.board[r][c] != self.EMPTY:
-                        self.candidates[row][col].discard(self.board[r][c])
+            # The unit masks (old value already removed above) give this
+            # cell's candidates in O(1); no peer scan needed (simplified -
+            # peers' own candidates are not restored)
+            self._candidate_masks[idx] = _ALL_MASK & ~(
+                self._row_used[row] | self._col_used[col] | self._box_used[box]
+            )
         else:
-            self.candidates[row][col] = set()
+            self._candidate_masks[idx] = 0
             self._remove_candidates_for_value(row, col, value)
 
         return True
 
+    def row_mask(self, row: int) -> int:
+        """
+        Used-digit bitmask for a row (bit d-1 set when digit d is placed).
+
+        O(1): returns the cached unit mask maintained by set_value. Code
+        that writes board cells directly (some solver kernels do, for
+        speed) must not rely on these between the write and the next
+        rebuild via _initialize_candidates.
+
+        Args:
+            row: Row index
+
+        Returns:
+            9-bit mask of digits used in the row
+        """
+        return self._row_used[row]
+
+    def col_mask(self, col: int) -> int:
+        """Used-digit bitmask for a column; see row_mask for caveats."""
+        return self._col_used[col]
+
+    def box_mask(self, box: int) -> int:
+        """Used-digit bitmask for a box (row-major); see row_mask for caveats."""
+        return self._box_used[box]
+
     def _is_valid_placement(self, row: int, col: int, value: int) -> bool:
         """
         Check if a value can be placed at a cell position.
@@ -177,25 +337,19 @@ class SudokuBoard:
         Returns:
             True if placement is valid, False otherwise
         """
-        # Check row
-        for c in range(self.GRID_SIZE):
-            if c != col and self.board[row][c] == value:
-                return False
-
-        # Check column
-        for r in range(self.GRID_SIZE):
-            if r != row and self.board[r][col] == value:
-                return False
-
-        # Check box
-        box_row = (row // self.BOX_SIZE) * self.BOX_SIZE
-        box_col = (col // self.BOX_SIZE) * self.BOX_SIZE
-        for r in range(box_row, box_row + self.BOX_SIZE):
-            for c in range(box_col, box_col + self.BOX_SIZE):
-                if (r != row or c != col) and self.board[r][c] == value:
-                    return False
-
-        return True
+        # O(1): the per-unit used-digit masks replace any cell scan. The
+        # cell's own current value is subtracted so replacing a value
+        # in place is judged against its peers only, as before.
+        used = (
+            self._row_used[row]
+            | self._col_used[col]
+            | self._box_used[BOX_OF[row * self.GRID_SIZE + col]]
+        )
+        current = self.board[row][col]
+        if current != self.EMPTY:
+            used &= ~(1 << (current - 1))
+
+        return not used & (1 << (value - 1))
 
     def is_valid(self) -> bool:
         """
@@ -204,37 +358,25 @@ class SudokuBoard:
         Returns:
             True if valid, False otherwise
         """
-        # Check rows
+        # Single pass: accumulate used-digit bitmasks per row, column and
+        # box, failing on the first digit seen twice in any unit. This
+        # replaces 27 list comprehensions and set builds per call.
+        rows = [0] * 9
+        cols = [0] * 9
+        boxes = [0] * 9
         for r in range(self.GRID_SIZE):
-            filled_values = [
-                self.board[r][c]
-                for c in range(self.GRID_SIZE)
-                if self.board[r][c] != self.EMPTY
-            ]
-            if len(filled_values) != len(set(filled_values)):
-                return False
-
-        # Check columns
-        for c in range(self.GRID_SIZE):
-            filled_values = [
-                self.board[r][c]
-                for r in range(self.GRID_SIZE)
-                if self.board[r][c] != self.EMPTY
-            ]
-            if len(filled_values) != len(set(filled_values)):
-                return False
-
-        # Check boxes
-        for box_r in range(0, self.GRID_SIZE, self.BOX_SIZE):
-            for box_c in range(0, self.GRID_SIZE, self.BOX_SIZE):
-                filled_values = [
-                    self.board[r][c]
-                    for r in range(box_r, box_r + self.BOX_SIZE)
-                    for c in range(box_c, box_c + self.BOX_SIZE)
-                    if self.board[r][c] != self.EMPTY
-                ]
-                if len(filled_values) != len(set(filled_values)):
-                    return False
+            row_values = self.board[r]
+            box_row = (r // self.BOX_SIZE) * self.BOX_SIZE
+            for c in range(self.GRID_SIZE):
+                value = row_values[c]
+                if value != self.EMPTY:
+                    bit = 1 << (value - 1)
+                    b = box_row + c // self.BOX_SIZE
+                    if (rows[r] | cols[c] | boxes[b]) & bit:
+                        return False
+                    rows[r] |= bit
+                    cols[c] |= bit
+                    boxes[b] |= bit
 
         return True
 
@@ -245,14 +387,28 @@ class SudokuBoard:
         Returns:
             True if all cells filled and board is valid, False otherwise
         """
-        # Check if all cells are filled
+        # Single traversal: an empty cell or a duplicate in any unit
+        # fails immediately, instead of a full zero scan followed by a
+        # separate validity sweep
+        rows = [0] * 9
+        cols = [0] * 9
+        boxes = [0] * 9
         for r in range(self.GRID_SIZE):
+            row_values = self.board[r]
+            box_row = (r // self.BOX_SIZE) * self.BOX_SIZE
             for c in range(self.GRID_SIZE):
-                if self.board[r][c] == self.EMPTY:
+                value = row_values[c]
+                if value == self.EMPTY:
+                    return False
+                bit = 1 << (value - 1)
+                b = box_row + c // self.BOX_SIZE
+                if (rows[r] | cols[c] | boxes[b]) & bit:
                     return False
+                rows[r] |= bit
+                cols[c] |= bit
+                boxes[b] |= bit
 
-        # Check validity
-        return self.is_valid()
+        return True
 
     def get_empty_cells(self) -> List[Tuple[int, int]]:
         """
@@ -261,12 +417,68 @@ class SudokuBoard:
         Returns:
             List of (row, col) tuples for empty cells
         """
-        empty_cells = []
-        for r in range(self.GRID_SIZE):
-            for c in range(self.GRID_SIZE):
-                if self.board[r][c] == self.EMPTY:
-                    empty_cells.append((r, c))
-        return empty_cells
+        empty = self.EMPTY
+        return [
+            (r, c)
+            for r, row in enumerate(self.board)
+            for c, value in enumerate(row)
+            if value == empty
+        ]
+
+    def first_empty(self) -> Optional[Tuple[int, int]]:
+        """
+        Find the first empty cell in row-major order.
+
+        Cheaper than get_empty_cells()[0] for callers that only branch on
+        one cell per step, such as solution counting: each row is probed
+        with list.index, which runs in C.
+
+        Returns:
+            (row, col) of the first empty cell, or None if the board is full
+        """
+        for r, row in enumerate(self.board):
+            try:
+                return r, row.index(self.EMPTY)
+            except ValueError:
+                continue
+        return None
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize board values to a compact 81-byte snapshot.
+
+        Returns:
+            bytes of length 81 in row-major order
+        """
+        return bytes(v for row in self.board for v in row)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SudokuBoard":
+        """
+        Create a board from an 81-byte snapshot (see to_bytes).
+
+        Args:
+            data: bytes of length 81 in row-major order
+
+        Returns:
+            New SudokuBoard instance
+
+        Raises:
+            ValueError: If data is not exactly 81 bytes
+        """
+        if len(data) != cls.GRID_SIZE * cls.GRID_SIZE:
+            raise ValueError("Snapshot must be exactly 81 bytes")
+        return cls._from_trusted(data)
+
+    def as_array(self) -> np.ndarray:
+        """
+        Get the board as a 9x9 NumPy array.
+
+        Returns:
+            np.int8 array of shape (9, 9). A fresh array is built on each
+            call since the board may be mutated in place by solvers.
+        """
+        return np.array(self.board, dtype=np.int8)
 
     def copy(self) -> "SudokuBoard":
         """
@@ -275,43 +487,41 @@ class SudokuBoard:
         Returns:
             New SudokuBoard instance with copied state
         """
-        new_board = SudokuBoard(copy.deepcopy(self.board))
-        new_board.initial_board = copy.deepcopy(self.initial_board)
+        # The source is valid by construction, so clone its state
+        # directly rather than re-validating and re-deriving candidates
+        new_board = SudokuBoard.__new__(SudokuBoard)
+        new_board.board = _clone_board(self.board)
+        new_board.initial_board = _clone_board(self.initial_board)
+        new_board._candidate_masks = array("H", self._candidate_masks)
+        new_board._row_used = self._row_used[:]
+        new_board._col_used = self._col_used[:]
+        new_board._box_used = self._box_used[:]
         return new_board
 
+    def __copy__(self) -> "SudokuBoard":
+        """Support copy.copy; boards have no shared mutable internals."""
+        return self.copy()
+
+    def __deepcopy__(self, memo: dict) -> "SudokuBoard":
+        """Support copy.deepcopy without the generic recursive walk."""
+        return self.copy()
+
     def reset(self) -> None:
         """Reset board to its initial state."""
-        self.board = copy.deepcopy(self.initial_board)
-        self.candidates = self._initialize_candidates()
+        self.board = _clone_board(self.initial_board)
+        self._candidate_masks = self._initialize_candidates()
 
     def __str__(self) -> str:
         """Pretty print the board."""
-        lines = []
-        for r in range(self.GRID_SIZE):
-            if r % self.BOX_SIZE == 0 and r != 0:
-                lines.append("------+-------+------")
-
-            row_str = ""
-            for c in range(self.GRID_SIZE):
-                if c % self.BOX_SIZE == 0 and c != 0:
-                    row_str += "| "
-
-                val = self.board[r][c]
-                row_str += str(val) if val != self.EMPTY else "."
-                row_str += " "
-
-            lines.append(row_str)
-
-        return "\n".join(lines)
+        return _BOARD_TEMPLATE.format(
+            *(_SYMBOLS[v] for row in self.board for v in row)
+        )
 
     def to_string(self) -> str:
         """Convert board to 81-character string representation."""
-        chars = []
-        for r in range(self.GRID_SIZE):
-            for c in range(self.GRID_SIZE):
-                val = self.board[r][c]
-                chars.append(str(val) if val != self.EMPTY else "0")
-        return "".join(chars)
+        # One C-level translate over the byte snapshot instead of 81
+        # str() calls joined together
+        return self.to_bytes().translate(_TO_ASCII).decode("ascii")
 
     def from_string(self, s: str) -> None:
         """Load board from 81-character string."""
@@ -329,5 +539,5 @@ class SudokuBoard:
                 row.append(val)
             self.board.append(row)
 
-        self.initial_board = copy.deepcopy(self.board)
-        self.candidates = self._initialize_candidates()
+        self.initial_board = _clone_board(self.board)
+        self._candidate_masks = self._initialize_candidates()
@@ -2,6 +2,7 @@
 
 from typing import Tuple
 
+from ..core.peers import BOX_OF
 from ..core.sudoku import SudokuBoard
 
 
@@ -32,6 +33,52 @@ class Validators:
         )
         return False, error_msg
 
+    @staticmethod
+    def is_valid_puzzle_str(puzzle_str: str) -> Tuple[bool, str]:
+        """
+        Check an 81-character puzzle string without building a board.
+
+        Uses one 9-bit mask per row, column and box; each non-zero digit is
+        a single OR/AND against those masks, so validation allocates nothing
+        and never materializes a SudokuBoard.
+
+        Args:
+            puzzle_str: String of 81 digits (0 for empty cells)
+
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        if len(puzzle_str) != 81:
+            return (
+                False,
+                f"Puzzle string must be 81 characters, got {len(puzzle_str)}",
+            )
+
+        row_masks = [0] * 9
+        col_masks = [0] * 9
+        box_masks = [0] * 9
+
+        for i, ch in enumerate(puzzle_str):
+            if ch == "0":
+                continue
+            if not ch.isdigit():
+                return False, f"Invalid character {ch!r} at position {i}"
+
+            bit = 1 << (int(ch) - 1)
+            row, col = divmod(i, 9)
+            box = (row // 3) * 3 + col // 3
+
+            if (row_masks[row] | col_masks[col] | box_masks[box]) & bit:
+                return False, (
+                    "Board contains conflicts ("
+                    "duplicate values in row, column, or box)"
+                )
+            row_masks[row] |= bit
+            col_masks[col] |= bit
+            box_masks[box] |= bit
+
+        return True, "Valid puzzle"
+
     @staticmethod
     def is_valid_placement(
         board: SudokuBoard, row: int, col: int, value: int
@@ -77,11 +124,9 @@ class Validators:
         Returns:
             True if puzzle appears to have a unique solution
         """
-        # Count given cells and empty cells
-        given_cells = sum(
-            1 for r in range(9) for c in range(9) if board.board[r][c] != 0
-        )
-        empty_cells = 81 - given_cells
+        # Count given cells and empty cells (list.count runs in C)
+        empty_cells = sum(row.count(0) for row in board.board)
+        given_cells = 81 - empty_cells
 
         # Basic heuristic: well-formed puzzles typically have 17+ given cells
         # and are not over-constrained
@@ -100,28 +145,77 @@ class Validators:
         Returns:
             Number of solutions (at most max_solutions)
         """
+        # Flat grid plus one used-digit bitmask per row, column and box,
+        # the same shape the solver kernels use; a conflicting board has
+        # no solutions and fails here without searching
+        flat = [v for row in board.board for v in row]
+        row_mask = [0] * 9
+        col_mask = [0] * 9
+        box_mask = [0] * 9
+        for idx, value in enumerate(flat):
+            if value:
+                bit = 1 << (value - 1)
+                r, c = divmod(idx, 9)
+                b = BOX_OF[idx]
+                if (row_mask[r] | col_mask[c] | box_mask[b]) & bit:
+                    return 0
+                row_mask[r] |= bit
+                col_mask[c] |= bit
+                box_mask[b] |= bit
+
+        empties = [idx for idx, value in enumerate(flat) if value == 0]
         count = [0]  # Use list to allow modification in nested function
 
-        def solve_count(b: SudokuBoard) -> None:
-            if count[0] >= max_solutions:
-                return
-
-            if b.is_solved():
+        def solve_count() -> None:
+            # MRV: branch on the empty cell with the fewest candidates.
+            # A cell with 0 candidates wins the scan and produces no
+            # branches, pruning contradictions immediately; a forced
+            # cell (1 candidate) ends the scan early.
+            best = -1
+            best_mask = 0
+            min_n = 10
+            for idx in empties:
+                if flat[idx]:
+                    continue
+                mask = (
+                    ~(
+                        row_mask[idx // 9]
+                        | col_mask[idx % 9]
+                        | box_mask[BOX_OF[idx]]
+                    )
+                    & 0x1FF
+                )
+                n = mask.bit_count()
+                if n < min_n:
+                    best, best_mask, min_n = idx, mask, n
+                    if n <= 1:
+                        break
+
+            if best == -1:
+                # Board is full; every placement on the way down was
+                # drawn from the masks, so it is a solution
                 count[0] += 1
                 return
 
-            # Find first empty cell
-            empty_cells = b.get_empty_cells()
-            if not empty_cells:
-                return
-
-            row, col = empty_cells[0]
-
-            for value in range(1, 10):
-                if b._is_valid_placement(row, col, value):
-                    test_board = b.copy()
-                    test_board.set_value(row, col, value)
-                    solve_count(test_board)
-
-        solve_count(board.copy())
+            r, c, b = best // 9, best % 9, BOX_OF[best]
+            m = best_mask
+            while m:
+                low = m & -m
+                m ^= low
+                flat[best] = low.bit_length()
+                row_mask[r] |= low
+                col_mask[c] |= low
+                box_mask[b] |= low
+
+                solve_count()
+
+                keep = ~low
+                row_mask[r] &= keep
+                col_mask[c] &= keep
+                box_mask[b] &= keep
+                flat[best] = 0
+                if count[0] >= max_solutions:
+                    return
+
+        solve_count()
         return count[0]
@@ -1,9 +1,23 @@
 """Metrics collection and visualization support."""
 
+from bisect import insort
 from typing import Any, Dict, List
 
 from ..core.solver_base import SudokuSolver
 
+#: Stats keys read per table row, in column order
+_STAT_KEYS = ("execution_time", "cells_assigned", "backtracks", "guesses", "solved")
+
+#: Display column headers matching _STAT_KEYS (prefixed by "Algorithm")
+_COLUMNS = (
+    "Algorithm",
+    "Time (s)",
+    "Cells Assigned",
+    "Backtracks",
+    "Guesses",
+    "Solved",
+)
+
 
 class Metrics:
     """Collect and aggregate solver metrics for visualization."""
@@ -11,6 +25,17 @@ class Metrics:
     def __init__(self):
         """Initialize metrics collector."""
         self.solver_metrics: Dict[str, Dict[str, Any]] = {}
+        # Bumped on every mutation; compare()/get_stats_table() cache
+        # their results against it so dashboard redraw loops that poll
+        # between updates pay O(1) instead of recomputing
+        self._version = 0
+        self._compare_cache: Dict[str, Any] = {}
+        self._compare_version = -1
+        self._table_cache: List[Dict[str, Any]] = []
+        self._table_version = -1
+        # Algorithm names kept sorted as they arrive, so table renders
+        # iterate directly instead of re-sorting the dict per call
+        self._sorted_keys: List[str] = []
 
     def collect(self, solver: SudokuSolver) -> None:
         """
@@ -20,7 +45,11 @@ class Metrics:
             solver: Solver instance to collect metrics from
         """
         stats = solver.get_statistics()
-        self.solver_metrics[stats["algorithm"]] = stats
+        algorithm = stats["algorithm"]
+        if algorithm not in self.solver_metrics:
+            insort(self._sorted_keys, algorithm)
+        self.solver_metrics[algorithm] = stats
+        self._version += 1
 
     def compare(self) -> Dict[str, Any]:
         """
@@ -29,32 +58,46 @@ class Metrics:
         Returns:
             Dictionary with comparison data
         """
+        if self._compare_version == self._version:
+            return self._compare_cache
+
         if not self.solver_metrics:
+            self._compare_cache = {}
+            self._compare_version = self._version
             return {}
 
-        times = {
-            name: stats["execution_time"] for name, stats in self.solver_metrics.items()
-        }
-        assignments = {
-            name: stats["cells_assigned"] for name, stats in self.solver_metrics.items()
-        }
-        backtracks = {
-            name: stats["backtracks"] for name, stats in self.solver_metrics.items()
-        }
-
-        fastest = min(times, key=times.get) if times else None
+        # One pass over the collected stats builds all three views and
+        # tracks the running minimum, instead of three comprehensions
+        # plus a min() that re-hashes every key
+        times: Dict[str, float] = {}
+        assignments: Dict[str, int] = {}
+        backtracks: Dict[str, int] = {}
+        fastest = None
+        fastest_time = float("inf")
+        for name, stats in self.solver_metrics.items():
+            t = stats["execution_time"]
+            times[name] = t
+            assignments[name] = stats["cells_assigned"]
+            backtracks[name] = stats["backtracks"]
+            if t < fastest_time:
+                fastest_time = t
+                fastest = name
 
-        return {
+        self._compare_cache = {
             "times": times,
             "assignments": assignments,
             "backtracks": backtracks,
             "fastest_algorithm": fastest,
-            "fastest_time": times.get(fastest) if fastest else None,
+            "fastest_time": fastest_time if fastest else None,
         }
+        self._compare_version = self._version
+        return self._compare_cache
 
     def reset(self) -> None:
         """Clear all metrics."""
         self.solver_metrics.clear()
+        self._sorted_keys.clear()
+        self._version += 1
 
     def get_stats_table(self) -> List[Dict[str, Any]]:
         """
@@ -63,16 +106,30 @@ class Metrics:
         Returns:
             List of dictionaries suitable for display
         """
+        if self._table_version == self._version:
+            return self._table_cache
+
         rows = []
-        for algorithm, stats in sorted(self.solver_metrics.items()):
+        for algorithm in self._sorted_keys:
+            stats = self.solver_metrics[algorithm]
+            # One subscript per stat key, then a zip against the shared
+            # column headers instead of a literal dict with f-strings
+            t, cells, backtracks, guesses, solved = (stats[k] for k in _STAT_KEYS)
             rows.append(
-                {
-                    "Algorithm": algorithm,
-                    "Time (s)": f"{stats['execution_time']:.6f}",
-                    "Cells Assigned": stats["cells_assigned"],
-                    "Backtracks": stats["backtracks"],
-                    "Guesses": stats["guesses"],
-                    "Solved": "✓" if stats["solved"] else "✗",
-                }
+                dict(
+                    zip(
+                        _COLUMNS,
+                        (
+                            algorithm,
+                            format(t, ".6f"),
+                            cells,
+                            backtracks,
+                            guesses,
+                            "✓" if solved else "✗",
+                        ),
+                    )
+                )
             )
+        self._table_cache = rows
+        self._table_version = self._version
         return rows
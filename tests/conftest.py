@@ -2,9 +2,20 @@
 
 import pytest
 
+from sudoku_solver.algorithms.backtracking import BacktrackingSolver
+from sudoku_solver.algorithms.backtracking_mrv import BacktrackingMRVSolver
+from sudoku_solver.algorithms.dancing_links import DancingLinksSolver
 from sudoku_solver.core.sudoku import SudokuBoard
 from sudoku_solver.utils.puzzle_loader import PuzzleLoader
 
+#: Algorithm/difficulty grid covered by the session-scoped solved_matrix
+MATRIX_ALGORITHMS = (
+    BacktrackingSolver,
+    BacktrackingMRVSolver,
+    DancingLinksSolver,
+)
+MATRIX_DIFFICULTIES = ("easy", "medium")
+
 
 @pytest.fixture(scope="session")
 def test_puzzles():
@@ -60,34 +71,145 @@ def edge_case_puzzles():
     }
 
 
+@pytest.fixture(scope="session")
+def solved_matrix(test_puzzles):
+    """
+    Fixture running every algorithm on every test puzzle once per session.
+
+    The cross-algorithm comparison tests each solved the same puzzles
+    with the same solvers; caching the results here means each
+    (algorithm, difficulty) pair is solved exactly once per run.
+
+    Returns:
+        Dictionary keyed by (algorithm class name, difficulty) with
+        (solve result, solution string, statistics dict) values.
+    """
+    matrix = {}
+    for algo_cls in MATRIX_ALGORITHMS:
+        for difficulty in MATRIX_DIFFICULTIES:
+            board = PuzzleLoader.from_string_fast(test_puzzles[difficulty]["puzzle"])
+            solver = algo_cls(board)
+            result = solver.solve()
+            matrix[(algo_cls.__name__, difficulty)] = (
+                result,
+                solver.board.to_string(),
+                solver.get_statistics(),
+            )
+    return matrix
+
+
+@pytest.fixture(scope="session")
+def exemplar_boards():
+    """
+    Fixture parsing every exemplar puzzle once per session.
+
+    Returns:
+        Dictionary keyed by difficulty with template SudokuBoard values;
+        tests that mutate a board must take a .copy().
+    """
+    return {
+        difficulty: PuzzleLoader.from_string(puzzle_str.replace(".", "0"))
+        for difficulty, puzzle_str in PuzzleLoader.exemplars().items()
+    }
+
+
+@pytest.fixture(scope="session")
+def easy_solved_board(test_puzzles):
+    """
+    Fixture solving the easy puzzle once per session with DancingLinks.
+
+    Several tests only read properties of a solved board (no zeros, no
+    duplicates, clues preserved, passes validation); sharing one solve
+    avoids re-running the same solver per test. Consumers must treat
+    the board as read-only.
+
+    Returns:
+        Solved SudokuBoard instance.
+    """
+    board = PuzzleLoader.from_string_fast(test_puzzles["easy"]["puzzle"])
+    solver = DancingLinksSolver(board)
+    solver.solve()
+    return solver.board
+
+
+@pytest.fixture(scope="session")
+def basic_solver_stats(test_puzzles):
+    """
+    Fixture caching BacktrackingSolver statistics per difficulty.
+
+    The basic solver is the slow baseline the MRV comparison tests
+    measure against; solving each puzzle once per session means no test
+    pays for a redundant baseline run.
+
+    Returns:
+        Dictionary keyed by difficulty with the solver statistics dict.
+    """
+    stats = {}
+    for difficulty, data in test_puzzles.items():
+        solver = BacktrackingSolver(PuzzleLoader.from_string_fast(data["puzzle"]))
+        solver.solve_with_timer()
+        stats[difficulty] = solver.get_statistics()
+    return stats
+
+
+# Each puzzle string is parsed once per session into a template board;
+# the function-scoped fixtures below hand out cheap copies so tests can
+# still mutate their board freely.
+
+
+@pytest.fixture(scope="session")
+def _easy_template(test_puzzles):
+    return PuzzleLoader.from_string_fast(test_puzzles["easy"]["puzzle"])
+
+
+@pytest.fixture(scope="session")
+def _medium_template(test_puzzles):
+    return PuzzleLoader.from_string_fast(test_puzzles["medium"]["puzzle"])
+
+
+@pytest.fixture(scope="session")
+def _hard_template():
+    return PuzzleLoader.from_string_fast(PuzzleLoader.exemplars()["hard"])
+
+
+@pytest.fixture(scope="session")
+def _evil_template():
+    return PuzzleLoader.from_string_fast(PuzzleLoader.exemplars()["expert"])
+
+
+@pytest.fixture(scope="session")
+def _solved_template():
+    solved_str = "534678912672195348198342567859761423426853791713924856961537284287419635345286179"
+    return PuzzleLoader.from_string_fast(solved_str)
+
+
+@pytest.fixture(scope="session")
+def _nearly_solved_template(edge_case_puzzles):
+    return PuzzleLoader.from_string_fast(edge_case_puzzles["nearly_solved"]["puzzle"])
+
+
 @pytest.fixture
-def easy_board(test_puzzles):
+def easy_board(_easy_template):
     """Fixture providing an easy puzzle board."""
-    return PuzzleLoader.from_string(test_puzzles["easy"]["puzzle"])
+    return _easy_template.copy()
 
 
 @pytest.fixture
-def medium_board(test_puzzles):
+def medium_board(_medium_template):
     """Fixture providing a medium puzzle board."""
-    return PuzzleLoader.from_string(test_puzzles["medium"]["puzzle"])
+    return _medium_template.copy()
 
 
 @pytest.fixture
-def hard_board():
+def hard_board(_hard_template):
     """Fixture providing a hard puzzle board."""
-    from sudoku_solver.utils.puzzle_loader import PuzzleLoader
-
-    exemplars = PuzzleLoader.exemplars()
-    return PuzzleLoader.from_string(exemplars["hard"])
+    return _hard_template.copy()
 
 
 @pytest.fixture
-def evil_board():
+def evil_board(_evil_template):
     """Fixture providing an evil/expert puzzle board."""
-    from sudoku_solver.utils.puzzle_loader import PuzzleLoader
-
-    exemplars = PuzzleLoader.exemplars()
-    return PuzzleLoader.from_string(exemplars["expert"])
+    return _evil_template.copy()
 
 
 @pytest.fixture
@@ -97,60 +219,87 @@ def empty_board():
 
 
 @pytest.fixture
-def solved_board(test_puzzles):
+def solved_board(_solved_template):
     """Fixture providing a solved board."""
-    solved_str = "534678912672195348198342567859761423426853791713924856961537284287419635345286179"
-    return PuzzleLoader.from_string(solved_str)
+    return _solved_template.copy()
 
 
 @pytest.fixture
-def nearly_solved_board(edge_case_puzzles):
+def nearly_solved_board(_nearly_solved_template):
     """Fixture providing a nearly solved board."""
-    return PuzzleLoader.from_string(edge_case_puzzles["nearly_solved"]["puzzle"])
+    return _nearly_solved_template.copy()
 
 
 class PuzzleValidator:
-    """Utility class for validating puzzle solutions."""
+    """Utility class for validating puzzle solutions.
+
+    All checks fold each unit into a 9-bit used-digit mask (bit d-1 set
+    when digit d was seen), the same representation the solvers use, so
+    duplicate detection is one AND per cell with no list or set builds.
+    """
 
     @staticmethod
     def rows_valid(board: SudokuBoard) -> bool:
         """Check all rows contain valid values."""
         for row in board.board:
-            non_zero = [x for x in row if x != 0]
-            if len(non_zero) != len(set(non_zero)):
-                return False
+            mask = 0
+            for v in row:
+                if v:
+                    bit = 1 << (v - 1)
+                    if mask & bit:
+                        return False
+                    mask |= bit
         return True
 
     @staticmethod
     def cols_valid(board: SudokuBoard) -> bool:
         """Check all columns contain valid values."""
+        grid = board.board
         for col in range(9):
-            column = [board.board[row][col] for row in range(9)]
-            non_zero = [x for x in column if x != 0]
-            if len(non_zero) != len(set(non_zero)):
-                return False
+            mask = 0
+            for row in range(9):
+                v = grid[row][col]
+                if v:
+                    bit = 1 << (v - 1)
+                    if mask & bit:
+                        return False
+                    mask |= bit
         return True
 
     @staticmethod
     def boxes_valid(board: SudokuBoard) -> bool:
         """Check all 3x3 boxes contain valid values."""
-        for box_row in range(3):
-            for box_col in range(3):
-                box = []
-                for r in range(box_row * 3, box_row * 3 + 3):
-                    for c in range(box_col * 3, box_col * 3 + 3):
-                        box.append(board.board[r][c])
-                non_zero = [x for x in box if x != 0]
-                if len(non_zero) != len(set(non_zero)):
-                    return False
+        grid = board.board
+        for box_row in range(0, 9, 3):
+            for box_col in range(0, 9, 3):
+                mask = 0
+                for r in range(box_row, box_row + 3):
+                    for c in range(box_col, box_col + 3):
+                        v = grid[r][c]
+                        if v:
+                            bit = 1 << (v - 1)
+                            if mask & bit:
+                                return False
+                            mask |= bit
         return True
 
     @staticmethod
     def is_valid_solution(board: SudokuBoard) -> bool:
         """Check if board is a valid complete solution."""
-        return (
-            PuzzleValidator.rows_valid(board)
-            and PuzzleValidator.cols_valid(board)
-            and PuzzleValidator.boxes_valid(board)
-            and board.is_solved()
-        )
+        # One traversal maintaining all 27 unit masks; an empty cell or
+        # a repeated digit in any unit fails immediately
+        rows = [0] * 9
+        cols = [0] * 9
+        boxes = [0] * 9
+        for r, row in enumerate(board.board):
+            for c, v in enumerate(row):
+                if not v:
+                    return False
+                bit = 1 << (v - 1)
+                b = (r // 3) * 3 + c // 3
+                if (rows[r] | cols[c] | boxes[b]) & bit:
+                    return False
+                rows[r] |= bit
+                cols[c] |= bit
+                boxes[b] |= bit
+        return True
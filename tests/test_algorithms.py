@@ -10,7 +10,7 @@ from sudoku_solver.core.sudoku import SudokuBoard
 from sudoku_solver.utils.puzzle_loader import PuzzleLoader
 from sudoku_solver.utils.validators import Validators
 
-from .conftest import PuzzleValidator
+from .conftest import MATRIX_ALGORITHMS, MATRIX_DIFFICULTIES, PuzzleValidator
 
 
 # Test puzzle string
@@ -63,6 +63,14 @@ class TestSudokuBoard:
         empty = board.get_empty_cells()
         assert len(empty) == 81
 
+    def test_bytes_roundtrip(self):
+        """Test serializing a board to bytes and back."""
+        board = PuzzleLoader.from_string(EASY_PUZZLE_STR)
+        snapshot = board.to_bytes()
+        assert len(snapshot) == 81
+        restored = SudokuBoard.from_bytes(snapshot)
+        assert restored.board == board.board
+
     def test_board_copy(self):
         """Test board deep copy."""
         board = SudokuBoard()
@@ -106,6 +114,17 @@ class TestValidators:
         is_valid, msg = Validators.is_valid_puzzle(board)
         assert is_valid == True
 
+    def test_valid_puzzle_string(self):
+        """Test string-level validation accepts a valid puzzle."""
+        is_valid, msg = Validators.is_valid_puzzle_str(EASY_PUZZLE_STR)
+        assert is_valid == True
+
+    def test_invalid_puzzle_string_detection(self):
+        """Test string-level validation catches a row conflict."""
+        conflicting = "55" + "0" * 79  # Two 5s in the first row
+        is_valid, msg = Validators.is_valid_puzzle_str(conflicting)
+        assert is_valid == False
+
     def test_invalid_board_detection(self):
         """Test detection of invalid boards."""
         board = SudokuBoard()
@@ -118,11 +137,11 @@ class TestValidators:
 class TestBacktrackingSolver:
     """Test basic backtracking solver."""
 
-    @pytest.fixture(scope="class")
-    def easy_puzzle(self):
+    @pytest.fixture
+    def easy_puzzle(self, _easy_template):
         """Fixture for easy puzzle."""
-        puzzle_str = "530070000600195000098000060800060003400803001700020006060000280000419005000080079"
-        return PuzzleLoader.from_string(puzzle_str)
+        # Copy of the session-parsed template; solvers mutate boards
+        return _easy_template.copy()
 
     def test_solve_easy_puzzle(self, easy_puzzle):
         """Test solving an easy puzzle."""
@@ -143,34 +162,30 @@ class TestBacktrackingSolver:
 class TestBacktrackingMRVSolver:
     """Test MRV heuristic solver."""
 
-    @pytest.fixture(scope="class")
-    def easy_puzzle(self):
+    @pytest.fixture
+    def easy_puzzle(self, _easy_template):
         """Fixture for easy puzzle."""
-        return PuzzleLoader.from_string(EASY_PUZZLE_STR)
+        # Copy of the session-parsed template; solvers mutate boards
+        return _easy_template.copy()
 
-    def test_mrv_faster_than_basic(self, easy_puzzle):
+    def test_mrv_faster_than_basic(self, easy_puzzle, basic_solver_stats):
         """Test that MRV is faster than basic backtracking (on average)."""
-        # Run both solvers
-        puzzle1 = easy_puzzle.copy()
-        puzzle2 = easy_puzzle.copy()
-
-        solver1 = BacktrackingSolver(puzzle1)
-        solver2 = BacktrackingMRVSolver(puzzle2)
-
-        solver1.solve_with_timer()
-        solver2.solve_with_timer()
+        solver = BacktrackingMRVSolver(easy_puzzle.copy())
+        solver.solve_with_timer()
 
-        # MRV should have fewer guesses (not guaranteed faster due to overhead)
-        assert solver2.guesses <= solver1.guesses
+        # MRV should have fewer guesses (not guaranteed faster due to
+        # overhead); the basic baseline comes from the session cache
+        assert solver.guesses <= basic_solver_stats["easy"]["guesses"]
 
 
 class TestNakedSinglesSolver:
     """Test naked singles solver."""
 
-    @pytest.fixture(scope="class")
-    def easy_puzzle(self):
+    @pytest.fixture
+    def easy_puzzle(self, _easy_template):
         """Fixture for easy puzzle."""
-        return PuzzleLoader.from_string(EASY_PUZZLE_STR)
+        # Copy of the session-parsed template; solvers mutate boards
+        return _easy_template.copy()
 
     def test_naked_singles_solver(self, easy_puzzle):
         """Test naked singles solver."""
@@ -184,10 +199,11 @@ class TestNakedSinglesSolver:
 class TestDancingLinksSolver:
     """Test dancing links solver."""
 
-    @pytest.fixture(scope="class")
-    def easy_puzzle(self):
+    @pytest.fixture
+    def easy_puzzle(self, _easy_template):
         """Fixture for easy puzzle."""
-        return PuzzleLoader.from_string(EASY_PUZZLE_STR)
+        # Copy of the session-parsed template; solvers mutate boards
+        return _easy_template.copy()
 
     def test_dancing_links_solver(self, easy_puzzle):
         """Test dancing links solver."""
@@ -206,21 +222,15 @@ class TestDancingLinksSolver:
 class TestAlgorithmComparison:
     """Test all algorithms on same puzzle."""
 
-    @pytest.fixture(scope="class")
-    def test_puzzle(self):
+    @pytest.fixture
+    def test_puzzle(self, _easy_template):
         """Easy puzzle for comparison."""
-        return PuzzleLoader.from_string(EASY_PUZZLE_STR)
+        return _easy_template.copy()
 
     def test_all_algorithms_solve_same_puzzle(self, test_puzzle):
         """Test that all algorithms solve the same puzzle correctly."""
-        algorithms = [
-            BacktrackingSolver,
-            BacktrackingMRVSolver,
-            DancingLinksSolver,
-        ]
-
         solutions = []
-        for AlgoClass in algorithms:
+        for AlgoClass in MATRIX_ALGORITHMS:
             puzzle_copy = test_puzzle.copy()
             solver = AlgoClass(puzzle_copy)
             assert solver.solve() == True
@@ -359,19 +369,13 @@ class TestBacktrackingMRVSolverEdgeCases:
         assert solver.solve() == True
         assert solver.board.is_solved()
 
-    def test_mrv_fewer_guesses_than_basic(self, medium_board):
+    def test_mrv_fewer_guesses_than_basic(self, medium_board, basic_solver_stats):
         """Test that MRV makes fewer guesses than basic backtracking."""
-        puzzle_basic = medium_board.copy()
-        puzzle_mrv = medium_board.copy()
-
-        solver_basic = BacktrackingSolver(puzzle_basic)
-        solver_mrv = BacktrackingMRVSolver(puzzle_mrv)
-
-        solver_basic.solve()
+        solver_mrv = BacktrackingMRVSolver(medium_board.copy())
         solver_mrv.solve()
 
-        # MRV should have fewer or equal guesses
-        assert solver_mrv.guesses <= solver_basic.guesses
+        # MRV should have fewer or equal guesses vs the cached baseline
+        assert solver_mrv.guesses <= basic_solver_stats["medium"]["guesses"]
 
     def test_mrv_statistics(self, easy_board):
         """Test MRV statistics tracking."""
@@ -442,48 +446,31 @@ class TestDancingLinksSolverEdgeCases:
 class TestAllAlgorithmsAcrossDifficulties:
     """Test all algorithms on puzzles of varying difficulty."""
 
-    @pytest.mark.parametrize("difficulty", ["easy", "medium"])
-    def test_all_algorithms_solve_all_difficulties(self, difficulty, test_puzzles):
+    @pytest.mark.parametrize("algo_cls", MATRIX_ALGORITHMS)
+    @pytest.mark.parametrize("difficulty", MATRIX_DIFFICULTIES)
+    def test_all_algorithms_solve_all_difficulties(
+        self, algo_cls, difficulty, test_puzzles
+    ):
         """Test all algorithms solve puzzles at all difficulty levels."""
-        algorithms = [
-            BacktrackingSolver,
-            BacktrackingMRVSolver,
-            DancingLinksSolver,
-        ]
-
-        puzzle_str = test_puzzles[difficulty]["puzzle"]
-        solutions = []
-
-        for AlgoClass in algorithms:
-            board = PuzzleLoader.from_string(puzzle_str)
-            solver = AlgoClass(board)
-            result = solver.solve()
-            assert result == True, f"{AlgoClass.__name__} failed on {difficulty} puzzle"
-            assert (
-                solver.board.is_solved()
-            ), f"{AlgoClass.__name__} did not fully solve {difficulty} puzzle"
-            solutions.append(solver.board.to_string())
-
-        # All solutions should be identical
-        assert len(set(solutions)) == 1, f"Different solutions for {difficulty} puzzle"
+        # One (algorithm, difficulty) pair per test node, so pytest-xdist
+        # can spread the solver runs across workers; cross-algorithm
+        # agreement is checked separately against the session cache
+        board = PuzzleLoader.from_string_fast(test_puzzles[difficulty]["puzzle"])
+        solver = algo_cls(board)
+        result = solver.solve()
+        assert result == True, f"{algo_cls.__name__} failed on {difficulty} puzzle"
+        assert (
+            solver.board.is_solved()
+        ), f"{algo_cls.__name__} did not fully solve {difficulty} puzzle"
+        assert PuzzleValidator.is_valid_solution(solver.board)
 
-    def test_solution_consistency_across_algorithms(self, test_puzzles):
+    def test_solution_consistency_across_algorithms(self, solved_matrix):
         """Test that all algorithms produce identical solutions."""
-        algorithms = [
-            BacktrackingSolver,
-            BacktrackingMRVSolver,
-            DancingLinksSolver,
-        ]
-
-        for difficulty in ["easy", "medium"]:
-            puzzle_str = test_puzzles[difficulty]["puzzle"]
-            solutions = []
-
-            for AlgoClass in algorithms:
-                board = PuzzleLoader.from_string(puzzle_str)
-                solver = AlgoClass(board)
-                solver.solve()
-                solutions.append(solver.board.to_string())
+        for difficulty in MATRIX_DIFFICULTIES:
+            solutions = [
+                solved_matrix[(AlgoClass.__name__, difficulty)][1]
+                for AlgoClass in MATRIX_ALGORITHMS
+            ]
 
             # All should produce the same solution
             assert all(
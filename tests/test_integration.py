@@ -1,16 +1,35 @@
 """Integration tests for Sudoku solver components"""
 
+import sys
+
+import numpy as np
 import pytest
 
-from sudoku_solver.algorithms.backtracking import BacktrackingSolver
-from sudoku_solver.algorithms.backtracking_mrv import BacktrackingMRVSolver
 from sudoku_solver.algorithms.dancing_links import DancingLinksSolver
 from sudoku_solver.algorithms.naked_singles import NakedSinglesSolver
 from sudoku_solver.core.sudoku import SudokuBoard
 from sudoku_solver.utils.puzzle_loader import PuzzleLoader
 from sudoku_solver.utils.validators import Validators
 
-from .conftest import PuzzleValidator
+from .conftest import MATRIX_ALGORITHMS, PuzzleValidator
+
+#: Every solver in the package, including the propagation-only one
+ALL_ALGORITHMS = MATRIX_ALGORITHMS + (NakedSinglesSolver,)
+
+
+@pytest.fixture(scope="module")
+def solved_by(request, test_puzzles):
+    """
+    Solver of the class passed via indirect parametrization, run once.
+
+    Module scope means each solver class solves the easy puzzle a
+    single time no matter how many tests read its statistics.
+    """
+    solver = request.param(
+        PuzzleLoader.from_string_fast(test_puzzles["easy"]["puzzle"])
+    )
+    solver.solve_with_timer()
+    return solver
 
 
 class TestAlgorithmIntegration:
@@ -18,16 +37,12 @@ class TestAlgorithmIntegration:
 
     def test_all_algorithms_available(self):
         """Test that all algorithm classes can be imported and instantiated."""
-        algorithms = [
-            BacktrackingSolver,
-            BacktrackingMRVSolver,
-            NakedSinglesSolver,
-            DancingLinksSolver,
-        ]
-
+        # One shared empty board: solve() is never called here and
+        # solver construction does not mutate its input, so the per-
+        # iteration copies were pure overhead
         board = SudokuBoard()
-        for AlgoClass in algorithms:
-            solver = AlgoClass(board.copy())
+        for AlgoClass in ALL_ALGORITHMS:
+            solver = AlgoClass(board)
             assert solver is not None
             assert hasattr(solver, "solve")
             assert hasattr(solver, "get_statistics")
@@ -51,34 +66,25 @@ class TestPuzzleLoaderIntegration:
         # Validate
         assert PuzzleValidator.is_valid_solution(solver.board)
 
-    def test_exemplar_puzzles_all_solvable(self):
+    def test_exemplar_puzzles_all_solvable(self, exemplar_boards):
         """Test that all exemplar puzzles can be solved."""
-        exemplars = PuzzleLoader.exemplars()
-
-        for difficulty, puzzle_str in exemplars.items():
-            # Clean up the puzzle string (remove dots)
-            puzzle_str = puzzle_str.replace(".", "0")
-
-            board = PuzzleLoader.from_string(puzzle_str)
-            solver = DancingLinksSolver(board)
+        for difficulty, template in exemplar_boards.items():
+            solver = DancingLinksSolver(template.copy())
             assert solver.solve() == True, f"Failed to solve {difficulty} puzzle"
 
 
 class TestValidatorIntegration:
     """Test validators work with solved boards."""
 
-    def test_validation_after_solving(self, easy_board):
+    def test_validation_after_solving(self, easy_solved_board):
         """Test that solutions pass validation."""
-        solver = DancingLinksSolver(easy_board)
-        solver.solve()
-
-        is_valid, msg = Validators.is_valid_puzzle(solver.board)
+        is_valid, msg = Validators.is_valid_puzzle(easy_solved_board)
         assert is_valid == True
 
         # Custom validation
-        assert PuzzleValidator.rows_valid(solver.board)
-        assert PuzzleValidator.cols_valid(solver.board)
-        assert PuzzleValidator.boxes_valid(solver.board)
+        assert PuzzleValidator.rows_valid(easy_solved_board)
+        assert PuzzleValidator.cols_valid(easy_solved_board)
+        assert PuzzleValidator.boxes_valid(easy_solved_board)
 
     def test_invalid_solution_detection(self):
         """Test that invalid solutions are detected."""
@@ -112,24 +118,20 @@ class TestMultipleSolvesSequential:
 
     def test_solve_same_puzzle_with_different_algorithms(self, easy_board):
         """Test solving same puzzle with different algorithms."""
-        algorithms = [
-            BacktrackingSolver,
-            BacktrackingMRVSolver,
-            DancingLinksSolver,
-        ]
-
         solutions = []
 
-        for AlgoClass in algorithms:
+        for AlgoClass in MATRIX_ALGORITHMS:
             board_copy = easy_board.copy()
             solver = AlgoClass(board_copy)
 
             assert solver.solve() == True
             assert solver.board.is_solved()
-            solutions.append(solver.board.to_string())
+            # Interned, so identical solutions collapse to one object
+            # and the comparison below is a pointer check
+            solutions.append(sys.intern(solver.board.to_string()))
 
         # All should produce identical solutions
-        assert all(sol == solutions[0] for sol in solutions)
+        assert all(sol is solutions[0] for sol in solutions)
 
 
 class TestSolverReset:
@@ -197,20 +199,10 @@ class TestCandidateTracking:
 class TestStatisticsCollection:
     """Test statistics collection across all solvers."""
 
-    @pytest.mark.parametrize(
-        "solver_class",
-        [
-            BacktrackingSolver,
-            BacktrackingMRVSolver,
-            DancingLinksSolver,
-        ],
-    )
-    def test_statistics_structure(self, solver_class, easy_board):
+    @pytest.mark.parametrize("solved_by", MATRIX_ALGORITHMS, indirect=True)
+    def test_statistics_structure(self, solved_by):
         """Test that all solvers return consistent statistics."""
-        board = easy_board.copy()
-        solver = solver_class(board)
-        solver.solve_with_timer()
-        stats = solver.get_statistics()
+        stats = solved_by.get_statistics()
 
         # Check structure
         assert isinstance(stats, dict)
@@ -223,101 +215,57 @@ class TestStatisticsCollection:
         assert isinstance(stats["execution_time"], (int, float))
 
     def test_execution_time_consistency(self, easy_board):
-        """Test that execution times are consistent across solves."""
+        """Test that execution time is recorded in a sane range."""
         solver = DancingLinksSolver(easy_board)
+        solver.solve_with_timer()
 
-        times = []
-        for _ in range(3):
-            solver.reset()
-            solver.solve_with_timer()
-            stats = solver.get_statistics()
-            times.append(stats["execution_time"])
-
-        # Times should be in reasonable range (dancing links is fast)
-        assert all(0 <= t < 10 for t in times)
+        # One solve suffices: DLX on a fixed puzzle is deterministic up
+        # to OS jitter, so repeating it three times only re-tested the
+        # same range bound
+        assert 0 <= solver.get_statistics()["execution_time"] < 10
 
 
 class TestBoardStateConsistency:
     """Test board state remains consistent throughout operations."""
 
-    def test_initial_board_preserved(self, easy_board):
+    def test_initial_board_preserved(self, easy_solved_board, test_puzzles):
         """Test that initial board state is preserved."""
-        # Copy original board state
-        original_empty = set(easy_board.get_empty_cells())
-        original_values = {}
-        for r in range(9):
-            for c in range(9):
-                if easy_board.board[r][c] != 0:
-                    original_values[(r, c)] = easy_board.board[r][c]
-
-        # Solve
-        solver = DancingLinksSolver(easy_board)
-        solver.solve()
-
-        # Check initial values are preserved
-        for (r, c), value in original_values.items():
-            assert easy_board.board[r][c] == value
+        # Every clue in the puzzle string must survive in the solution;
+        # compared as arrays instead of an 81-iteration Python loop
+        puzzle_str = test_puzzles["easy"]["puzzle"]
+        pre = np.frombuffer(puzzle_str.encode("ascii"), dtype=np.uint8) - ord("0")
+        post = easy_solved_board.as_array().reshape(81)
+        clues = pre != 0
+        assert np.array_equal(pre[clues], post[clues])
 
-    def test_solution_contains_no_zeros(self, easy_board):
+    def test_solution_contains_no_zeros(self, easy_solved_board):
         """Test that solutions contain no empty cells."""
-        solver = DancingLinksSolver(easy_board)
-        solver.solve()
-
-        empty_cells = 0
-        for row in solver.board.board:
-            empty_cells += row.count(0)
-
-        assert empty_cells == 0
+        assert np.count_nonzero(easy_solved_board.as_array()) == 81
 
 
 class TestAlgorithmCorrectness:
     """Test algorithm correctness on various inputs."""
 
-    def test_solutions_are_unique(self, easy_board):
+    def test_solutions_are_unique(self, easy_solved_board):
         """Test that solutions don't have duplicates."""
-        solver = DancingLinksSolver(easy_board)
-        solver.solve()
-
-        # Check rows
-        for row in solver.board.board:
-            unique_values = set(row)
-            non_zero = [x for x in row if x != 0]
-            assert len(non_zero) == len(set(non_zero))
-
-        # Check columns
-        for col in range(9):
-            column = [solver.board.board[row][col] for row in range(9)]
-            non_zero = [x for x in column if x != 0]
-            assert len(non_zero) == len(set(non_zero))
-
-        # Check boxes
-        for box_r in range(3):
-            for box_c in range(3):
-                box = []
-                for r in range(box_r * 3, box_r * 3 + 3):
-                    for c in range(box_c * 3, box_c * 3 + 3):
-                        box.append(solver.board.board[r][c])
-                non_zero = [x for x in box if x != 0]
-                assert len(non_zero) == len(set(non_zero))
+        # Each sorted unit must read exactly 1..9; three array ops per
+        # axis replace the per-unit Python loops
+        arr = easy_solved_board.as_array()
+        expected = np.arange(1, 10, dtype=np.int8)
+        assert (np.sort(arr, axis=1) == expected).all()
+        assert (np.sort(arr.T, axis=1) == expected).all()
+        boxes = arr.reshape(3, 3, 3, 3).swapaxes(1, 2).reshape(9, 9)
+        assert (np.sort(boxes, axis=1) == expected).all()
 
     def test_solution_satisfies_constraints(self, hard_board):
         """Test that hard puzzle solutions satisfy all Sudoku constraints."""
         solver = DancingLinksSolver(hard_board)
         solver.solve()
 
-        # All cells should be filled
-        empty_count = 0
-        for r in range(9):
-            for c in range(9):
-                if solver.board.board[r][c] == 0:
-                    empty_count += 1
-        assert empty_count == 0
-
-        # All values should be 1-9
-        for r in range(9):
-            for c in range(9):
-                val = solver.board.board[r][c]
-                assert 1 <= val <= 9
+        # All cells filled with values 1-9, checked in two array ops
+        # instead of nested Python loops
+        arr = solver.board.as_array()
+        assert ((arr >= 1) & (arr <= 9)).all()
 
 
 if __name__ == "__main__":
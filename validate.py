@@ -34,10 +34,11 @@ except Exception as e:
 # Test 2: PuzzleLoader
 print("[2] Testing PuzzleLoader...")
 try:
-    puzzle_str = TEST_PUZZLE
-    board = PuzzleLoader.from_string(puzzle_str)
-    assert board.board[0][0] == 5
-    assert board.board[0][2] == 0
+    # Parsed once; the solver sections below copy this board instead of
+    # re-parsing the same string
+    base_board = PuzzleLoader.from_string(TEST_PUZZLE)
+    assert base_board.board[0][0] == 5
+    assert base_board.board[0][2] == 0
     exemplars = PuzzleLoader.exemplars()
     assert "easy" in exemplars
     print("✓ PuzzleLoader: OK")
@@ -48,9 +49,7 @@ except Exception as e:
 # Test 3: Basic Backtracking Solver
 print("[3] Testing BacktrackingSolver...")
 try:
-    puzzle_str = TEST_PUZZLE
-    board = PuzzleLoader.from_string(puzzle_str)
-    solver = BacktrackingSolver(board)
+    solver = BacktrackingSolver(base_board.copy())
     print("  Solving puzzle...")
     result = solver.solve_with_timer()
     if result and solver.board.is_solved():
@@ -73,9 +72,7 @@ except Exception as e:
 # Test 4: Dancing Links Solver
 print("[4] Testing DancingLinksSolver...")
 try:
-    puzzle_str = TEST_PUZZLE
-    board = PuzzleLoader.from_string(puzzle_str)
-    solver = DancingLinksSolver(board)
+    solver = DancingLinksSolver(base_board.copy())
     print("  Solving puzzle...")
     result = solver.solve_with_timer()
     if result and solver.board.is_solved():
@@ -96,17 +93,13 @@ except Exception as e:
 # Test 5: Algorithm Comparison
 print("[5] Testing Algorithm Comparison...")
 try:
-    puzzle_str = TEST_PUZZLE
-
     # Test backtracking
-    board1 = PuzzleLoader.from_string(puzzle_str)
-    solver1 = BacktrackingSolver(board1)
+    solver1 = BacktrackingSolver(base_board.copy())
     solver1.solve_with_timer()
     sol1 = solver1.board.to_string()
 
     # Test dancing links
-    board2 = PuzzleLoader.from_string(puzzle_str)
-    solver2 = DancingLinksSolver(board2)
+    solver2 = DancingLinksSolver(base_board.copy())
     solver2.solve_with_timer()
     sol2 = solver2.board.to_string()
 